@@ -20,7 +20,7 @@ MAX_RETRIES = 3
 RETRY_DELAYS = [1, 2, 4]  # Exponential backoff in seconds
 
 # Telegram iteration batch size
-BATCH_SIZE = 100  # Messages per Telethon iteration
+BATCH_SIZE = 200  # Messages per Telethon iteration (amortizes one RTT per batch)
 
 #Link opener wait_time
 wait_time = 18
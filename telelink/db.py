@@ -2,12 +2,33 @@
 TeleLink — SQLite Persistence Layer
 All queries use parameterised statements (no string formatting).
 """
+import csv
+import io
+import itertools
+import json
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime
 
 import pandas as pd
 
+# Arrow CSV writer (multi-threaded C++, emits UTF-8 bytes directly) —
+# optional, the csv.writer paging path below keeps working without it.
+try:
+    import pyarrow as _pa
+    import pyarrow.csv as _pa_csv
+except ImportError:
+    _pa = None  # type: ignore[assignment]
+    _pa_csv = None  # type: ignore[assignment]
+
+# Let pysqlite stringify datetime parameters in C instead of a Python
+# str() call per row in the save_links rowbuilder.
+sqlite3.register_adapter(datetime, lambda d: d.isoformat())
+
 
 # ── Schema ────────────────────────────────────────────────────────────
 
@@ -47,32 +68,195 @@ CREATE TABLE IF NOT EXISTS channels (
     message_count   INTEGER DEFAULT 0,
     link_count      INTEGER DEFAULT 0
 );
+
+-- Covering indexes for the hot WHERE/ORDER BY paths (avoid temp B-tree sorts)
+CREATE INDEX IF NOT EXISTS idx_msg_chan_date   ON messages(channel_name, message_date DESC);
+CREATE INDEX IF NOT EXISTS idx_msg_chan_msgid  ON messages(channel_name, message_id DESC);
+CREATE INDEX IF NOT EXISTS idx_msg_chan_haslink ON messages(channel_name, has_link, message_date DESC);
+-- Partial index: "With links only" across all channels seeks instead of scanning
+CREATE INDEX IF NOT EXISTS idx_msg_haslink ON messages(message_date DESC) WHERE has_link = 1;
+CREATE INDEX IF NOT EXISTS idx_links_chan_date ON links(channel_name, message_date DESC);
+CREATE INDEX IF NOT EXISTS idx_links_domain    ON links(domain);
+CREATE INDEX IF NOT EXISTS idx_links_source    ON links(source);
+CREATE INDEX IF NOT EXISTS idx_links_url       ON links(url);
 """
 
 
+def _apply_pragmas(conn: sqlite3.Connection, db_path: Path | str):
+    """Tune the connection: WAL + relaxed sync for concurrent reads/writes."""
+    if str(db_path) != ":memory:":
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA wal_autocheckpoint=1000")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA cache_size=-65536")       # ~64 MB page cache
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.execute("PRAGMA mmap_size=268435456")     # 256 MB mmap window
+
+
 def init_db(db_path: Path | str | None = None) -> sqlite3.Connection:
     """Create / open DB and ensure tables exist. Returns connection."""
     if db_path is None:
         from config import DB_PATH
         db_path = DB_PATH
     conn = sqlite3.connect(str(db_path), check_same_thread=False)
+    _apply_pragmas(conn, db_path)
     conn.executescript(_SCHEMA_SQL)
+    # PRAGMA optimize re-analyzes only tables whose stats look stale —
+    # a bare ANALYZE here re-scanned the whole DB on every process start.
+    conn.execute("PRAGMA optimize")
     conn.commit()
     return conn
 
 
-# ── CRUD helpers ──────────────────────────────────────────────────────
+# ── Connection pooling ────────────────────────────────────────────────
+#    Under WAL, SQLite supports 1 writer + N concurrent readers.
+#    A DBHandle pairs the single writer with a pool of read-only
+#    connections so UI queries never queue behind a scrape batch.
 
-def save_messages(conn: sqlite3.Connection, messages: list[dict]) -> int:
-    """INSERT OR IGNORE a batch of message dicts. Returns rows inserted."""
-    sql = """
-        INSERT OR IGNORE INTO messages
-            (message_id, channel_name, sender_id, message_text,
-             message_date, has_link)
-        VALUES (?, ?, ?, ?, ?, ?)
+def open_writer(db_path: Path | str) -> sqlite3.Connection:
+    """Open THE writer connection (autocommit off via isolation_level=None)."""
+    conn = sqlite3.connect(
+        str(db_path), check_same_thread=False, isolation_level=None
+    )
+    _apply_pragmas(conn, db_path)
+    conn.executescript(_SCHEMA_SQL)
+    conn.execute("PRAGMA optimize")
+    return conn
+
+
+def open_reader_pool(db_path: Path | str, n: int = 4) -> "queue.Queue[sqlite3.Connection]":
+    """Open N read-only connections and return them in a Queue pool."""
+    pool: queue.Queue[sqlite3.Connection] = queue.Queue()
+    for _ in range(n):
+        conn = sqlite3.connect(
+            f"file:{db_path}?mode=ro", uri=True, check_same_thread=False
+        )
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
+        pool.put(conn)
+    return pool
+
+
+@dataclass
+class DBHandle:
+    """Writer connection + read-only pool. Accepted anywhere a plain
+    sqlite3.Connection is (helpers route reads/writes appropriately)."""
+    writer: sqlite3.Connection
+    readers: "queue.Queue[sqlite3.Connection]" = field(default=None)  # type: ignore[assignment]
+
+
+def open_db(db_path: Path | str | None = None, readers: int = 4) -> DBHandle:
+    """Open a DBHandle with a writer plus a read-only pool."""
+    if db_path is None:
+        from config import DB_PATH
+        db_path = DB_PATH
+    writer = open_writer(db_path)
+    pool = open_reader_pool(db_path, readers) if str(db_path) != ":memory:" else None
+    return DBHandle(writer=writer, readers=pool)
+
+
+def _write_conn(conn) -> sqlite3.Connection:
+    """Resolve the writer from either a DBHandle or a raw connection."""
+    return conn.writer if isinstance(conn, DBHandle) else conn
+
+
+# Serializes every writer in this process. Scrape tasks write from the
+# bridge-loop thread while Clear Data / HTML import / Add Channel write
+# from Streamlit script threads through the same cached connection —
+# without this, two overlapping BEGIN IMMEDIATEs raise "cannot start a
+# transaction within a transaction" and the loser's ROLLBACK discards
+# the winner's in-flight batch. RLock so _insert_chunked can hold it
+# across its chunks while _write_txn re-acquires per transaction.
+_WRITE_LOCK = threading.RLock()
+
+
+@contextmanager
+def _write_txn(conn: sqlite3.Connection):
+    """BEGIN IMMEDIATE ... COMMIT around a write batch.
+
+    Grabs the process write lock, then SQLite's, up front (no mid-batch
+    lock upgrade, so no SQLITE_BUSY storms against the reader pool) and
+    pays one fsync per batch instead of one per statement.
     """
-    rows = [
-        (
+    with _WRITE_LOCK:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+
+# Rows per transaction for bulk loads — bounds both RSS and WAL growth.
+_BULK_CHUNK = 10_000
+
+
+def _insert_chunked(conn: sqlite3.Connection, sql: str, rows) -> int:
+    """Stream rows (any iterable) into executemany, 10k per transaction.
+
+    Routine flushes (under one chunk — the scrape path flushes every
+    ~0.5 s) are a single plain transaction. Only genuinely bulk loads
+    (HTML import and the like) engage the pragma dance: cache spill and
+    auto-checkpointing off for the duration so no checkpoint lands
+    mid-batch, then one WAL truncate at the end — small flushes never
+    pay that checkpoint's fsync or contend with the reader pool. Holds
+    the process write lock throughout so another writer never
+    interleaves with the pragma toggles.
+    """
+    inserted = 0
+    it = iter(rows)
+    with _WRITE_LOCK:
+        first = list(itertools.islice(it, _BULK_CHUNK))
+        if not first:
+            return 0
+        with _write_txn(conn):
+            cur = conn.executemany(sql, first)
+        inserted += cur.rowcount
+        if len(first) < _BULK_CHUNK:
+            return inserted
+        conn.execute("PRAGMA cache_spill=OFF")
+        conn.execute("PRAGMA wal_autocheckpoint=0")
+        try:
+            while True:
+                chunk = list(itertools.islice(it, _BULK_CHUNK))
+                if not chunk:
+                    break
+                with _write_txn(conn):
+                    cur = conn.executemany(sql, chunk)
+                inserted += cur.rowcount
+        finally:
+            conn.execute("PRAGMA wal_autocheckpoint=1000")
+            conn.execute("PRAGMA cache_spill=ON")
+            try:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.OperationalError:
+                pass
+    return inserted
+
+
+@contextmanager
+def _read_conn(conn):
+    """Check a reader out of the pool (or pass a raw connection through)."""
+    if isinstance(conn, DBHandle) and conn.readers is not None:
+        reader = conn.readers.get()
+        try:
+            yield reader
+        finally:
+            conn.readers.put(reader)
+    else:
+        yield _write_conn(conn)
+
+
+# ── CRUD helpers ──────────────────────────────────────────────────────
+
+def _message_row(m) -> tuple:
+    """Row tuple from either a message dict or a ScrapedMessage record."""
+    if isinstance(m, dict):
+        return (
             m["message_id"],
             m["channel_name"],
             m.get("sender_id"),
@@ -80,72 +264,134 @@ def save_messages(conn: sqlite3.Connection, messages: list[dict]) -> int:
             m.get("date", ""),
             1 if m.get("has_link") else 0,
         )
-        for m in messages
-    ]
-    cur = conn.executemany(sql, rows)
-    conn.commit()
-    return cur.rowcount
+    return (
+        m.message_id,
+        m.channel_name,
+        m.sender_id,
+        m.text,
+        m.date,
+        1 if m.has_link else 0,
+    )
+
+
+def save_messages(conn: sqlite3.Connection, messages: list) -> int:
+    """INSERT OR IGNORE a batch of messages (dicts or ScrapedMessage).
+    Returns rows inserted."""
+    conn = _write_conn(conn)
+    sql = """
+        INSERT OR IGNORE INTO messages
+            (message_id, channel_name, sender_id, message_text,
+             message_date, has_link)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+    return _insert_chunked(conn, sql, (_message_row(m) for m in messages))
+
+
+def save_message_columns(conn: sqlite3.Connection, cols: dict) -> int:
+    """INSERT OR IGNORE messages supplied as parallel column lists
+    (the shape produced by fetch_message_column_batches). Returns rows
+    inserted."""
+    conn = _write_conn(conn)
+    sql = """
+        INSERT OR IGNORE INTO messages
+            (message_id, channel_name, sender_id, message_text,
+             message_date, has_link)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+    rows = zip(
+        cols["message_id"],
+        cols["channel_name"],
+        cols["sender_id"],
+        cols["text"],
+        cols["date"],
+        (1 if h else 0 for h in cols["has_link"]),
+    )
+    return _insert_chunked(conn, sql, rows)
 
 
 def save_links(conn: sqlite3.Connection, links: list) -> int:
     """INSERT OR IGNORE a batch of LinkRecord objects. Returns rows inserted."""
+    conn = _write_conn(conn)
     sql = """
         INSERT OR IGNORE INTO links
             (url, domain, anchor_text, source, message_id,
              message_date, channel_name, forward_from)
         VALUES (?, ?, ?, ?, ?, ?, ?, ?)
     """
-    rows = [
+    rows = (
         (
             lr.url,
             lr.domain,
             lr.anchor_text,
             lr.source,
             lr.message_id,
-            str(lr.message_date) if lr.message_date else "",
+            lr.message_date,
             lr.channel_name,
             getattr(lr, "forward_from", None),
         )
         for lr in links
+    )
+    return _insert_chunked(conn, sql, rows)
+
+
+_UPSERT_CHANNEL_SQL = """
+    INSERT INTO channels (channel_name, display_name, member_count,
+                          last_scraped, message_count, link_count)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(channel_name) DO UPDATE SET
+        display_name = excluded.display_name,
+        member_count = excluded.member_count,
+        last_scraped = excluded.last_scraped,
+        message_count = excluded.message_count,
+        link_count    = excluded.link_count
+"""
+
+
+def upsert_channels(conn: sqlite3.Connection, channel_infos: list[dict]):
+    """Insert or update a batch of channel metadata dicts in one transaction."""
+    conn = _write_conn(conn)
+    # One timestamp per batch; dict.get with a computed default would call
+    # datetime.now() for every row even when last_scraped is supplied.
+    now_iso = datetime.now().isoformat()
+    rows = [
+        (
+            info.get("channel_name", ""),
+            info.get("display_name", ""),
+            info.get("member_count", 0),
+            info.get("last_scraped") or now_iso,
+            info.get("message_count", 0),
+            info.get("link_count", 0),
+        )
+        for info in channel_infos
     ]
-    cur = conn.executemany(sql, rows)
-    conn.commit()
-    return cur.rowcount
+    with _write_txn(conn):
+        conn.executemany(_UPSERT_CHANNEL_SQL, rows)
 
 
 def upsert_channel(conn: sqlite3.Connection, channel_info: dict):
     """Insert or update channel metadata."""
-    sql = """
-        INSERT INTO channels (channel_name, display_name, member_count,
-                              last_scraped, message_count, link_count)
-        VALUES (?, ?, ?, ?, ?, ?)
-        ON CONFLICT(channel_name) DO UPDATE SET
-            display_name = excluded.display_name,
-            member_count = excluded.member_count,
-            last_scraped = excluded.last_scraped,
-            message_count = excluded.message_count,
-            link_count    = excluded.link_count
-    """
-    conn.execute(sql, (
-        channel_info.get("channel_name", ""),
-        channel_info.get("display_name", ""),
-        channel_info.get("member_count", 0),
-        channel_info.get("last_scraped", datetime.now().isoformat()),
-        channel_info.get("message_count", 0),
-        channel_info.get("link_count", 0),
-    ))
-    conn.commit()
+    upsert_channels(conn, [channel_info])
 
 
 # ── Query helpers ─────────────────────────────────────────────────────
 
-def get_messages(
-    conn: sqlite3.Connection,
-    channel: str | None = None,
-    keyword: str | None = None,
-    has_link: bool | None = None,
-) -> pd.DataFrame:
-    """Return messages as a DataFrame with optional filters."""
+def _query_df(conn: sqlite3.Connection, sql: str, params=()) -> pd.DataFrame:
+    """Run a SELECT and build a DataFrame straight from the cursor rows.
+
+    Cheaper than pd.read_sql_query, which allocates per-column Python
+    lists and re-detects types on every call.
+    """
+    cur = conn.execute(sql, params)
+    columns = [d[0] for d in cur.description]
+    return pd.DataFrame.from_records(cur.fetchall(), columns=columns)
+
+
+def _message_filters(
+    channel: str | None,
+    keyword: str | None,
+    has_link: bool | None,
+) -> tuple[str, list]:
+    """Shared WHERE-clause builder for the message queries/exports."""
     clauses: list[str] = []
     params: list = []
 
@@ -161,8 +407,77 @@ def get_messages(
         clauses.append("has_link = 0")
 
     where = ("WHERE " + " AND ".join(clauses)) if clauses else ""
+    return where, params
+
+
+def get_messages(
+    conn: sqlite3.Connection,
+    channel: str | None = None,
+    keyword: str | None = None,
+    has_link: bool | None = None,
+) -> pd.DataFrame:
+    """Return messages as a DataFrame with optional filters."""
+    where, params = _message_filters(channel, keyword, has_link)
     sql = f"SELECT * FROM messages {where} ORDER BY message_date DESC"
-    return pd.read_sql_query(sql, conn, params=params)
+    with _read_conn(conn) as rconn:
+        return _query_df(rconn, sql, params)
+
+
+def stream_messages_csv(
+    conn: sqlite3.Connection,
+    channel: str | None = None,
+    keyword: str | None = None,
+    has_link: bool | None = None,
+    page: int = 10_000,
+) -> bytes:
+    """Build the messages CSV straight off the cursor in fetchmany pages.
+
+    With pyarrow installed the rows serialize through Arrow's C++ CSV
+    writer (multi-threaded, emits UTF-8 bytes with no intermediate str);
+    otherwise csv.writer pages keep peak extra memory at one page of
+    rows plus the output buffer.
+    """
+    where, params = _message_filters(channel, keyword, has_link)
+    sql = f"SELECT * FROM messages {where} ORDER BY message_date DESC"
+    with _read_conn(conn) as rconn:
+        cur = rconn.execute(sql, params)
+        cols = [d[0] for d in cur.description]
+        if _pa is not None:
+            rows = cur.fetchall()
+            table = _pa.table(
+                {
+                    name: _pa.array(col)
+                    for name, col in zip(cols, zip(*rows) if rows else ([],) * len(cols))
+                }
+            )
+            sink = io.BytesIO()
+            _pa_csv.write_csv(table, sink)
+            return sink.getvalue()
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(cols)
+        while rows := cur.fetchmany(page):
+            writer.writerows(rows)
+    return buf.getvalue().encode("utf-8")
+
+
+def stream_messages_json(
+    conn: sqlite3.Connection,
+    channel: str | None = None,
+    keyword: str | None = None,
+    has_link: bool | None = None,
+    page: int = 10_000,
+) -> bytes:
+    """messages → JSON records, paged off the cursor like the CSV path."""
+    where, params = _message_filters(channel, keyword, has_link)
+    sql = f"SELECT * FROM messages {where} ORDER BY message_date DESC"
+    records: list[dict] = []
+    with _read_conn(conn) as rconn:
+        cur = rconn.execute(sql, params)
+        cols = [d[0] for d in cur.description]
+        while rows := cur.fetchmany(page):
+            records.extend(dict(zip(cols, r)) for r in rows)
+    return json.dumps(records, indent=2, default=str).encode("utf-8")
 
 
 def get_links(
@@ -172,69 +487,142 @@ def get_links(
     unique_only: bool = False,
     search: str | None = None,
 ) -> pd.DataFrame:
-    """Return links as a DataFrame with optional filters."""
+    """Return links as a DataFrame with optional filters.
+
+    Each row also carries the source message's text (LEFT JOIN on
+    messages), so exports don't need a second IN(...) round-trip.
+    """
     clauses: list[str] = []
     params: list = []
 
     if channel and channel != "All":
-        clauses.append("channel_name = ?")
+        clauses.append("l.channel_name = ?")
         params.append(channel)
     if domain and domain != "All":
-        clauses.append("domain = ?")
+        clauses.append("l.domain = ?")
         params.append(domain)
     if search:
-        clauses.append("url LIKE ?")
+        clauses.append("l.url LIKE ?")
         params.append(f"%{search}%")
 
     where = ("WHERE " + " AND ".join(clauses)) if clauses else ""
 
     if unique_only:
         sql = f"""
-            SELECT url, domain, anchor_text, source, channel_name,
-                   MIN(message_date) AS message_date, message_id
-            FROM links {where}
-            GROUP BY url
+            SELECT l.url, l.domain, l.anchor_text, l.source, l.channel_name,
+                   MIN(l.message_date) AS message_date, l.message_id,
+                   m.message_text
+            FROM links l
+            LEFT JOIN messages m
+                ON l.channel_name = m.channel_name
+               AND l.message_id = m.message_id
+            {where}
+            GROUP BY l.url
             ORDER BY message_date DESC
         """
     else:
-        sql = f"SELECT * FROM links {where} ORDER BY message_date DESC"
+        sql = f"""
+            SELECT l.*, m.message_text
+            FROM links l
+            LEFT JOIN messages m
+                ON l.channel_name = m.channel_name
+               AND l.message_id = m.message_id
+            {where}
+            ORDER BY l.message_date DESC
+        """
 
-    return pd.read_sql_query(sql, conn, params=params)
+    with _read_conn(conn) as rconn:
+        return _query_df(rconn, sql, params)
 
 
 def get_channel_stats(conn: sqlite3.Connection) -> pd.DataFrame:
     """Return per-channel statistics."""
     sql = "SELECT * FROM channels ORDER BY last_scraped DESC"
-    return pd.read_sql_query(sql, conn)
+    with _read_conn(conn) as rconn:
+        return _query_df(rconn, sql)
+
+
+def get_top_domains(conn: sqlite3.Connection, limit: int = 20) -> pd.DataFrame:
+    """Top domains by link count — aggregated inside SQLite.
+
+    One index scan over idx_links_domain; the UI never pulls the full
+    links table just to chart 20 rows.
+    """
+    sql = """
+        SELECT domain, COUNT(*) AS links
+        FROM links
+        WHERE domain IS NOT NULL AND domain != ''
+        GROUP BY domain
+        ORDER BY links DESC
+        LIMIT ?
+    """
+    with _read_conn(conn) as rconn:
+        return _query_df(rconn, sql, [limit])
+
+
+def get_links_per_day(conn: sqlite3.Connection) -> pd.DataFrame:
+    """Link counts per calendar day (ISO date prefix of message_date)."""
+    sql = """
+        SELECT substr(message_date, 1, 10) AS day, COUNT(*) AS links
+        FROM links
+        WHERE message_date IS NOT NULL
+        GROUP BY day
+        ORDER BY day
+    """
+    with _read_conn(conn) as rconn:
+        return _query_df(rconn, sql)
+
+
+def get_source_counts(conn: sqlite3.Connection) -> pd.DataFrame:
+    """Link counts per extraction source (entity/regex/button/...)."""
+    sql = """
+        SELECT source, COUNT(*) AS links
+        FROM links
+        GROUP BY source
+        ORDER BY links DESC
+    """
+    with _read_conn(conn) as rconn:
+        return _query_df(rconn, sql)
 
 
 def get_domain_list(conn: sqlite3.Connection) -> list[str]:
     """Return sorted list of unique domains."""
-    cur = conn.execute(
-        "SELECT DISTINCT domain FROM links WHERE domain IS NOT NULL ORDER BY domain"
-    )
-    return [row[0] for row in cur.fetchall()]
+    with _read_conn(conn) as rconn:
+        # GROUP BY walks idx_links_domain directly — no DISTINCT temp B-tree
+        cur = rconn.execute(
+            "SELECT domain FROM links WHERE domain IS NOT NULL "
+            "GROUP BY domain ORDER BY domain"
+        )
+        return [row[0] for row in cur.fetchall()]
 
 
 def get_channel_list(conn: sqlite3.Connection) -> list[str]:
     """Return sorted list of unique channel names."""
-    cur = conn.execute(
-        "SELECT DISTINCT channel_name FROM channels ORDER BY channel_name"
-    )
-    return [row[0] for row in cur.fetchall()]
+    with _read_conn(conn) as rconn:
+        # channel_name is UNIQUE — DISTINCT would be a no-op sort step
+        cur = rconn.execute(
+            "SELECT channel_name FROM channels ORDER BY channel_name"
+        )
+        return [row[0] for row in cur.fetchall()]
 
 
 def get_last_message_id(conn: sqlite3.Connection, channel_name: str) -> int:
     """Return the max scraped message_id for a channel (for incremental scraping)."""
-    cur = conn.execute(
-        "SELECT COALESCE(MAX(message_id), 0) FROM messages WHERE channel_name = ?",
-        (channel_name,),
-    )
-    return cur.fetchone()[0]
+    with _read_conn(conn) as rconn:
+        # Single B-tree descent down idx_msg_chan_msgid instead of a
+        # MAX() scan over the channel partition.
+        cur = rconn.execute(
+            "SELECT message_id FROM messages WHERE channel_name = ? "
+            "ORDER BY message_id DESC LIMIT 1",
+            (channel_name,),
+        )
+        row = cur.fetchone()
+        return row[0] if row else 0
 
 
 def clear_channel(conn: sqlite3.Connection, channel_name: str):
     """Delete ALL data for a given channel from every table."""
-    for table in ("messages", "links", "channels"):
-        conn.execute(f"DELETE FROM {table} WHERE channel_name = ?", (channel_name,))
-    conn.commit()
+    conn = _write_conn(conn)
+    with _write_txn(conn):
+        for table in ("messages", "links", "channels"):
+            conn.execute(f"DELETE FROM {table} WHERE channel_name = ?", (channel_name,))
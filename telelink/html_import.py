@@ -4,6 +4,10 @@ TeleLink — HTML Import Module
 Extracts messages and button links from Telegram Desktop's exported HTML files.
 This provides a fallback when the Telegram API can't be used (private channels,
 auth issues, etc.)
+
+Parsing uses selectolax (C HTML tokenizer) when available — one tokenization
+pass instead of six regex passes per message — and falls back to the original
+regex parser otherwise.
 """
 from __future__ import annotations
 
@@ -12,6 +16,85 @@ from pathlib import Path
 from dataclasses import dataclass
 from typing import List
 
+# Fast C parser (imported lazily so the regex fallback keeps working without it)
+try:
+    from selectolax.parser import HTMLParser as _SelectolaxParser
+except ImportError:
+    _SelectolaxParser = None  # type: ignore[assignment, misc]
+
+# Streaming parser for very large exports (keeps one message in RAM at a time)
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:
+    _lxml_etree = None  # type: ignore[assignment]
+
+# Above this size, slurping the whole file (bytes + decoded str + parse tree)
+# costs several times the file size in RAM — stream instead.
+_STREAM_THRESHOLD = 64 * 1024 * 1024  # 64 MB
+
+# ── Compiled patterns (module scope — compiled once, bound methods in loops) ──
+
+# Message-block sentinel (regex fallback splitter)
+_MSG_PREFIX = '<div class="message '
+# Date from message div
+_DATE_RE = re.compile(r'title="(\d{2}\.\d{2}\.\d{4} \d{2}:\d{2}:\d{2}[^"]*)"')
+# Message text
+_TEXT_RE = re.compile(r'<div class="text">\s*(.*?)\s*</div>', re.DOTALL)
+# Bot button links
+_BUTTON_RE = re.compile(
+    r'<div class="bot_button">\s*<a[^>]*href="([^"]+)"[^>]*>.*?<div>\s*(.*?)\s*</div>',
+    re.DOTALL,
+)
+# Message ID
+_ID_RE = re.compile(r'id="message(\d+)"')
+# URL regex
+_URL_RE = re.compile(r'https?://[^\s<>"\']+', re.IGNORECASE)
+# Inline <a href="..."> links in message text
+_TEXT_LINK_RE = re.compile(r'<a[^>]*href="([^"]+)"[^>]*>')
+# Bot buttons table section
+_TABLE_RE = re.compile(r'<table class="bot_buttons_table">(.*?)</table>', re.DOTALL)
+# Tag stripping / whitespace collapsing
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# Hyperscan URL scanner (SIMD DFA — optional, regex fallback below)
+try:
+    import hyperscan as _hyperscan
+except ImportError:
+    _hyperscan = None  # type: ignore[assignment]
+
+_HS_DB = None
+if _hyperscan is not None:
+    try:
+        _HS_DB = _hyperscan.Database()
+        _HS_DB.compile(
+            expressions=[rb'https?://[^\s<>"\'\)]+'],
+            ids=[0],
+            flags=[_hyperscan.HS_FLAG_CASELESS | _hyperscan.HS_FLAG_SOM_LEFTMOST],
+        )
+    except Exception:
+        _HS_DB = None
+
+
+def _scan_urls(text: str) -> list[str]:
+    """Return every http(s) URL in text, in order of appearance.
+
+    Uses Hyperscan when installed; Hyperscan reports a match at every end
+    offset, so keep only the longest match per start offset.
+    """
+    if _HS_DB is None:
+        return _URL_RE.findall(text)
+    data = text.encode("utf-8", "surrogatepass")
+    longest: dict[int, int] = {}
+    def _on_match(_id, start, end, _flags, _ctx):
+        if end > longest.get(start, 0):
+            longest[start] = end
+    _HS_DB.scan(data, match_event_handler=_on_match)
+    return [
+        data[start:end].decode("utf-8", "ignore")
+        for start, end in sorted(longest.items())
+    ]
+
 
 @dataclass
 class HTMLMessage:
@@ -27,40 +110,163 @@ def parse_telegram_html(html_path: str) -> List[HTMLMessage]:
     Parse a Telegram Desktop export HTML file.
     Returns list of HTMLMessage objects with text, buttons, and links.
     """
-    html = Path(html_path).read_text(encoding="utf-8")
+    path = Path(html_path)
+    if _lxml_etree is not None and path.stat().st_size > _STREAM_THRESHOLD:
+        return list(_iter_html_lxml(path))
+    # Hand raw bytes to selectolax: tokenization AND charset decoding both
+    # happen inside the C parser, so Python never materializes or validates
+    # a whole-file str. Only the regex fallback needs the decoded copy.
+    data = path.read_bytes()
+    if _SelectolaxParser is not None:
+        return _parse_html_selectolax(data)
+    return _parse_html_regex(data.decode("utf-8"))
+
+
+# ── lxml streaming path (large exports) ───────────────────────────────
+
+def _iter_html_lxml(path: Path):
+    """Stream the export through HTMLPullParser, yielding one HTMLMessage per
+    message div and freeing the tree as we go (lxml fast_iter pattern)."""
+    parser = _lxml_etree.HTMLPullParser(events=("end",), tag="div")
+
+    def _emit(elem):
+        node_id = elem.get("id") or ""
+        if not node_id.startswith("message"):
+            return None
+        try:
+            msg_id = int(node_id[len("message"):])
+        except ValueError:
+            return None
+
+        date_node = elem.find('.//div[@class="pull_right date details"]')
+        date_str = date_node.get("title", "") if date_node is not None else ""
+
+        clean_text = ""
+        text_links: list[str] = []
+        text_links_set: set[str] = set()
+        text_node = elem.find('.//div[@class="text"]')
+        if text_node is not None:
+            clean_text = _WS_RE.sub(' ', " ".join(text_node.itertext())).strip()
+            for a in text_node.iter("a"):
+                href = a.get("href") or ""
+                if href.startswith("http") and href not in text_links_set:
+                    text_links_set.add(href)
+                    text_links.append(href)
+            for url in _scan_urls(clean_text):
+                if url not in text_links_set:
+                    text_links_set.add(url)
+                    text_links.append(url)
+
+        buttons: list[dict] = []
+        table = elem.find('.//table[@class="bot_buttons_table"]')
+        if table is not None:
+            for a in table.iter("a"):
+                url = a.get("href") or ""
+                if not url:
+                    continue
+                label = _WS_RE.sub(' ', " ".join(a.itertext())).strip()
+                buttons.append({"label": label, "url": url})
+
+        if buttons or text_links or clean_text:
+            return HTMLMessage(
+                message_id=msg_id,
+                text=clean_text,
+                date=date_str,
+                buttons=buttons,
+                text_links=text_links,
+            )
+        return None
+
+    with open(path, "rb", buffering=1 << 20) as fh:
+        while True:
+            chunk = fh.read(1 << 20)
+            if not chunk:
+                break
+            parser.feed(chunk)
+            for _event, elem in parser.read_events():
+                cls = elem.get("class") or ""
+                if not cls.startswith("message default clearfix"):
+                    continue
+                msg = _emit(elem)
+                if msg is not None:
+                    yield msg
+                # Free the subtree and everything before it
+                elem.clear()
+                parent = elem.getparent()
+                if parent is not None:
+                    while elem.getprevious() is not None:
+                        del parent[0]
+    parser.close()
+
+
+# ── selectolax fast path ──────────────────────────────────────────────
 
-    # Split into individual message blocks
-    # Each message ends right before the next message or end of history
-    msg_blocks = re.split(
-        r'(?=<div class="message (?:default|service) clearfix(?: joined)?")',
-        html,
-    )
+def _parse_html_selectolax(html: str | bytes) -> List[HTMLMessage]:
+    """Single-pass CSS-selector parse of the export (no per-message regexes)."""
+    tree = _SelectolaxParser(html)
+    results: list[HTMLMessage] = []
+
+    for node in tree.css("div.message.default.clearfix"):
+        node_id = node.attributes.get("id") or ""
+        if not node_id.startswith("message"):
+            continue
+        try:
+            msg_id = int(node_id[len("message"):])
+        except ValueError:
+            continue
+
+        # Date from the details div's title attribute
+        date_node = node.css_first("div.pull_right.date.details")
+        date_str = (date_node.attributes.get("title") or "") if date_node else ""
+
+        # Message text + inline links
+        clean_text = ""
+        text_links: list[str] = []
+        text_links_set: set[str] = set()
+        text_node = node.css_first("div.text")
+        if text_node:
+            clean_text = _WS_RE.sub(' ', text_node.text(separator=" ")).strip()
+            for a in text_node.css("a[href]"):
+                href = a.attributes.get("href") or ""
+                if href.startswith("http") and href not in text_links_set:
+                    text_links_set.add(href)
+                    text_links.append(href)
+            for url in _scan_urls(clean_text):
+                if url not in text_links_set:
+                    text_links_set.add(url)
+                    text_links.append(url)
 
-    # Extract date from message div
-    date_pattern = re.compile(
-        r'title="(\d{2}\.\d{2}\.\d{4} \d{2}:\d{2}:\d{2}[^"]*)"'
-    )
+        # Bot button links
+        buttons: list[dict] = []
+        table = node.css_first("table.bot_buttons_table")
+        if table is not None:
+            for a in table.css("a[href]"):
+                url = a.attributes.get("href") or ""
+                if not url:
+                    continue
+                label = _WS_RE.sub(' ', a.text(separator=" ")).strip()
+                buttons.append({"label": label, "url": url})
 
-    # Message text
-    text_pattern = re.compile(
-        r'<div class="text">\s*(.*?)\s*</div>',
-        re.DOTALL,
-    )
+        if buttons or text_links or clean_text:
+            results.append(HTMLMessage(
+                message_id=msg_id,
+                text=clean_text,
+                date=date_str,
+                buttons=buttons,
+                text_links=text_links,
+            ))
 
-    # Bot button links
-    button_pattern = re.compile(
-        r'<div class="bot_button">\s*<a[^>]*href="([^"]+)"[^>]*>.*?<div>\s*(.*?)\s*</div>',
-        re.DOTALL,
-    )
+    return results
 
-    # Message ID
-    id_pattern = re.compile(r'id="message(\d+)"')
 
-    # URL regex
-    url_re = re.compile(r'https?://[^\s<>"\']+', re.IGNORECASE)
+# ── Regex fallback ────────────────────────────────────────────────────
 
-    # Inline <a href="..."> links in message text
-    text_link_pattern = re.compile(r'<a[^>]*href="([^"]+)"[^>]*>')
+def _parse_html_regex(html: str) -> List[HTMLMessage]:
+    """Original regex-based parser (used when selectolax is not installed)."""
+    # Split into individual message blocks with a C-level str.split on the
+    # literal div prefix (the old lookahead-regex split backtracked per char).
+    # Each message ends right before the next message or end of history.
+    msg_blocks = [_MSG_PREFIX + part for part in html.split(_MSG_PREFIX)[1:]]
 
     results: list[HTMLMessage] = []
 
@@ -69,46 +275,44 @@ def parse_telegram_html(html_path: str) -> List[HTMLMessage]:
             continue
 
         # Get message ID
-        id_match = id_pattern.search(block)
+        id_match = _ID_RE.search(block)
         if not id_match:
             continue
         msg_id = int(id_match.group(1))
 
         # Get date
-        date_match = date_pattern.search(block)
+        date_match = _DATE_RE.search(block)
         date_str = date_match.group(1) if date_match else ""
 
         # Get text (strip HTML tags)
-        text_match = text_pattern.search(block)
+        text_match = _TEXT_RE.search(block)
         raw_text = text_match.group(1) if text_match else ""
-        clean_text = re.sub(r'<[^>]+>', ' ', raw_text).strip()
-        clean_text = re.sub(r'\s+', ' ', clean_text)
+        clean_text = _TAG_RE.sub(' ', raw_text).strip()
+        clean_text = _WS_RE.sub(' ', clean_text)
 
         # Get text-body links (from <a href> and plain URLs)
         text_links: list[str] = []
+        text_links_set: set[str] = set()
         if text_match:
-            for link_match in text_link_pattern.finditer(raw_text):
+            for link_match in _TEXT_LINK_RE.finditer(raw_text):
                 href = link_match.group(1)
-                if href.startswith("http"):
+                if href.startswith("http") and href not in text_links_set:
+                    text_links_set.add(href)
                     text_links.append(href)
-            for url_match in url_re.finditer(clean_text):
-                url = url_match.group(0)
-                if url not in text_links:
+            for url in _scan_urls(clean_text):
+                if url not in text_links_set:
+                    text_links_set.add(url)
                     text_links.append(url)
 
         # Get button links
         buttons: list[dict] = []
         # Only look at bot_buttons_table section
-        table_match = re.search(
-            r'<table class="bot_buttons_table">(.*?)</table>',
-            block,
-            re.DOTALL,
-        )
+        table_match = _TABLE_RE.search(block)
         if table_match:
             table_html = table_match.group(1)
-            for btn_match in button_pattern.finditer(table_html):
+            for btn_match in _BUTTON_RE.finditer(table_html):
                 url = btn_match.group(1)
-                label = re.sub(r'<[^>]+>', '', btn_match.group(2)).strip()
+                label = _TAG_RE.sub('', btn_match.group(2)).strip()
                 buttons.append({"label": label, "url": url})
 
         # Only include messages that have links or buttons
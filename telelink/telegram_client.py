@@ -13,6 +13,8 @@ from __future__ import annotations
 import re as _re
 
 import asyncio
+import functools
+import random
 import time
 from datetime import datetime, timezone
 from typing import AsyncGenerator, Callable, Optional
@@ -26,10 +28,63 @@ from telethon.errors import (
     UserDeactivatedError,
     PhoneCodeInvalidError,
 )
-from telethon.tl.types import MessageFwdHeader
+from telethon.tl.functions.channels import GetFullChannelRequest
+from telethon.tl.types import (
+    MessageFwdHeader,
+    MessageEntityTextUrl,
+    MessageEntityUrl,
+    MessageMediaWebPage,
+)
 
 from config import MAX_RETRIES, RETRY_DELAYS, BATCH_SIZE
 
+# Hot-loop constants — fetch_messages touches these once per message.
+_URL_RE = _re.compile(r'https?://')
+_URL_ENTITY_TYPES = (MessageEntityTextUrl, MessageEntityUrl)
+
+# Optional Hyperscan DFA for the URL test (single SIMD pass; regex fallback)
+try:
+    import hyperscan as _hyperscan
+except ImportError:
+    _hyperscan = None
+
+_HS_URL_DB = None
+if _hyperscan is not None:
+    try:
+        _HS_URL_DB = _hyperscan.Database()
+        _HS_URL_DB.compile(expressions=[rb'https?://'], ids=[0],
+                           flags=[_hyperscan.HS_FLAG_CASELESS])
+    except Exception:
+        _HS_URL_DB = None
+
+
+def _text_has_url(text: str) -> bool:
+    """True if text contains an http(s) URL (Hyperscan when available)."""
+    if _HS_URL_DB is None:
+        return _URL_RE.search(text) is not None
+    hit = []
+    _HS_URL_DB.scan(
+        text.encode("utf-8", "surrogatepass"),
+        match_event_handler=lambda *_args: hit.append(True),
+    )
+    return bool(hit)
+
+@functools.lru_cache(maxsize=1024)
+def _iso_date(dt) -> str:
+    """Cached datetime→isoformat. Messages in a batch frequently share a
+    timestamp down to the second, so repeats skip the string build."""
+    return dt.isoformat()
+
+
+def _retry_delay(attempt: int) -> float:
+    """Backoff delay with ±50% jitter so parallel retries don't synchronize."""
+    return RETRY_DELAYS[attempt] * random.uniform(0.5, 1.5)
+
+
+# web.telegram.org URLs carry the channel ID in the hash fragment
+_WEB_ID_RE = _re.compile(r'#(-?\d+)')
+_WEB_URL_PREFIXES = ("https://web.telegram.org", "http://web.telegram.org", "web.telegram.org")
+
 
 # ── Custom Exceptions ─────────────────────────────────────────────────
 
@@ -57,6 +112,33 @@ class InvalidOTPError(Exception):
     """Raised when the OTP code is incorrect."""
 
 
+# ── Message record ────────────────────────────────────────────────────
+
+class ScrapedMessage:
+    """One scraped message. __slots__ keeps it ~half the size of the old
+    8-key dict and makes field access a C-level slot read downstream."""
+
+    __slots__ = (
+        "message_id", "text", "date", "sender_id",
+        "has_link", "channel_name", "forward_from", "raw_message",
+    )
+
+    def __init__(self, message_id, text, date, sender_id,
+                 has_link, channel_name, forward_from, raw_message):
+        self.message_id = message_id
+        self.text = text
+        self.date = date
+        self.sender_id = sender_id
+        self.has_link = has_link
+        self.channel_name = channel_name
+        self.forward_from = forward_from
+        self.raw_message = raw_message
+
+    def as_dict(self) -> dict:
+        """Dict view for callers that still want the old shape."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 # ── Wrapper ───────────────────────────────────────────────────────────
 
 class TelethonWrapper:
@@ -68,6 +150,7 @@ class TelethonWrapper:
         self.session_name = session_name
         self.client = TelegramClient(session_name, api_id, api_hash, loop=loop)
         self._phone_code_hash: str | None = None
+        self._entity_cache: dict = {}
 
     # ── Connection ────────────────────────────────────────────────────
 
@@ -79,7 +162,7 @@ class TelethonWrapper:
                 return True
             except (ConnectionError, OSError):
                 if attempt < MAX_RETRIES - 1:
-                    await asyncio.sleep(RETRY_DELAYS[attempt])
+                    await asyncio.sleep(_retry_delay(attempt))
                 else:
                     raise
         return False
@@ -134,8 +217,8 @@ class TelethonWrapper:
         identifier = identifier.strip()
 
         # web.telegram.org URL → extract numeric ID from hash fragment
-        if "web.telegram.org" in identifier:
-            m = _re.search(r'#(-?\d+)', identifier)
+        if identifier.startswith(_WEB_URL_PREFIXES):
+            m = _WEB_ID_RE.search(identifier)
             if m:
                 raw_id = int(m.group(1))
                 # Web client uses plain negative IDs for channels;
@@ -144,28 +227,44 @@ class TelethonWrapper:
                     return int(f"-100{abs(raw_id)}")
                 return raw_id
 
-        # Pure numeric string (possibly with minus sign)
-        if identifier.lstrip("-").isdigit():
+        # Pure numeric string (possibly with minus sign) — sliced check
+        # instead of lstrip() so nothing is allocated
+        digits = identifier[1:] if identifier.startswith("-") else identifier
+        if digits.isdigit():
             return int(identifier)
 
         return identifier
 
     # ── Channel helpers ───────────────────────────────────────────────
 
+    async def _resolve(self, resolved: str | int):
+        """get_entity with a per-wrapper cache — one RTT per identifier."""
+        entity = self._entity_cache.get(resolved)
+        if entity is None:
+            entity = await self.client.get_entity(resolved)
+            self._entity_cache[resolved] = entity
+        return entity
+
     async def get_channel_info(self, identifier: str) -> dict:
         """Fetch channel metadata. Returns dict with name, id, etc."""
         resolved = self._parse_identifier(identifier)
         try:
-            entity = await self.client.get_entity(resolved)
-            full = await self.client.get_entity(entity)
+            entity = await self._resolve(resolved)
+            # One GetFullChannelRequest for the member count — re-passing the
+            # entity through get_entity round-trips without adding anything.
+            try:
+                full = await self.client(GetFullChannelRequest(entity))
+                member_count = getattr(full.full_chat, "participants_count", 0) or 0
+            except Exception:
+                member_count = getattr(entity, "participants_count", 0) or 0
             return {
                 "name": getattr(entity, "username", None) or str(entity.id),
                 "channel_name": getattr(entity, "username", None) or str(entity.id),
                 "id": entity.id,
                 "username": getattr(entity, "username", None),
-                "member_count": getattr(full, "participants_count", 0) or 0,
+                "member_count": member_count,
                 "display_name": getattr(entity, "title", "") or getattr(entity, "username", ""),
-                "description": "",  # full chat info requires extra call
+                "description": "",
             }
         except ChannelPrivateError:
             raise NotMemberError(identifier)
@@ -188,6 +287,11 @@ class TelethonWrapper:
         """
         Yield message dicts from a channel.
 
+        FloodWait and dropped connections auto-resume in place: the wait
+        (or reconnect) happens here and iteration continues below the last
+        yielded id on the already-resolved entity — callers never need to
+        re-invoke.
+
         Parameters
         ----------
         identifier : str
@@ -195,7 +299,8 @@ class TelethonWrapper:
         limit : int | None
             Max messages to fetch (None = all).
         from_date, to_date : datetime | None
-            Date range filter (UTC).
+            Date range filter (UTC). Naive inputs are normalized here
+            once; message dates from Telethon are always tz-aware UTC.
         keyword : str | None
             Telegram server-side search filter (REC-10).
         progress_callback : callable | None
@@ -206,13 +311,15 @@ class TelethonWrapper:
             Only fetch messages with id > min_id (incremental, REC-02).
         """
         resolved = self._parse_identifier(identifier)
-        entity = await self.client.get_entity(resolved)
+        entity = await self._resolve(resolved)
+        channel_name = getattr(entity, "username", None) or str(entity.id)
 
         # Build iter_messages kwargs
         iter_kwargs: dict = {
             "entity": entity,
             "limit": limit,
             "min_id": min_id,
+            "wait_time": 0,  # no artificial inter-request pause; FloodWait is handled below
         }
         if keyword:
             iter_kwargs["search"] = keyword  # REC-10
@@ -222,98 +329,220 @@ class TelethonWrapper:
                 to_date = to_date.replace(tzinfo=timezone.utc)
             iter_kwargs["offset_date"] = to_date
 
-        fetched = 0
-        try:
-            async for msg in self.client.iter_messages(**iter_kwargs):
-                # Stop signal
-                if stop_event and stop_event.is_set():
-                    break
+        # Normalize once — Telethon dates are tz-aware, so the per-message
+        # comparison below needs no further .replace() allocations.
+        from_dt = None
+        if from_date:
+            from_dt = (
+                from_date
+                if from_date.tzinfo
+                else from_date.replace(tzinfo=timezone.utc)
+            )
 
-                # Date range — skip messages outside from_date
-                if from_date and msg.date:
-                    msg_date = msg.date.replace(tzinfo=timezone.utc) if msg.date.tzinfo is None else msg.date
-                    from_dt = from_date.replace(tzinfo=timezone.utc) if from_date.tzinfo is None else from_date
-                    if msg_date < from_dt:
+        fetched = 0
+        last_yielded_id = 0
+        while True:
+            try:
+                async for msg in self.client.iter_messages(**iter_kwargs):
+                    # Stop signal
+                    if stop_event and stop_event.is_set():
+                        break
+
+                    # Bind hot attributes once — each msg.<attr> is a
+                    # descriptor call on Telethon's TLObject.
+                    msg_date = msg.date
+                    msg_text = msg.message
+                    msg_entities = msg.entities
+
+                    # Date range — Telethon builds msg.date from the Unix
+                    # timestamp with tzinfo=UTC, always, so no per-message
+                    # tzinfo check or None guard is needed here.
+                    if from_dt is not None and msg_date < from_dt:
                         break  # messages are in reverse-chrono order
 
-                # Determine forward source (REC-09)
-                forward_from = None
-                if msg.fwd_from and isinstance(msg.fwd_from, MessageFwdHeader):
-                    if msg.fwd_from.from_name:
-                        forward_from = msg.fwd_from.from_name
-                    elif msg.fwd_from.from_id:
-                        forward_from = str(msg.fwd_from.from_id)
-
-                # Check if message has any link entities, buttons, or media
-                has_link = False
-                if msg.entities:
-                    from telethon.tl.types import MessageEntityTextUrl, MessageEntityUrl
-                    for ent in msg.entities:
-                        if isinstance(ent, (MessageEntityTextUrl, MessageEntityUrl)):
+                    # Determine forward source (REC-09) — fwd_from is always
+                    # MessageFwdHeader | None per the TL schema.
+                    fwd = msg.fwd_from
+                    forward_from = None
+                    if fwd is not None:
+                        forward_from = fwd.from_name or (
+                            str(fwd.from_id) if fwd.from_id else None
+                        )
+
+                    # Link detection — text regex first: one C-level search
+                    # answers most messages (with or without links) before any
+                    # entity/button/media walking.
+                    has_link = bool(msg_text) and _text_has_url(msg_text)
+                    if not has_link and msg_entities:
+                        has_link = any(isinstance(e, _URL_ENTITY_TYPES) for e in msg_entities)
+                    # Check inline keyboard buttons — flat any() short-circuits
+                    # at the first URL without the nested for/break dance
+                    if not has_link:
+                        rm = msg.reply_markup
+                        if rm is not None:
+                            rows = getattr(rm, "rows", None)
+                            if rows:
+                                has_link = any(
+                                    getattr(b, "url", None)
+                                    for row in rows
+                                    for b in row.buttons
+                                )
+                    # Check webpage preview
+                    if not has_link and msg.media:
+                        if isinstance(msg.media, MessageMediaWebPage):
                             has_link = True
-                            break
-                # Check inline keyboard buttons
-                if not has_link and msg.reply_markup:
-                    for row in getattr(msg.reply_markup, "rows", []):
-                        for btn in getattr(row, "buttons", []):
-                            if getattr(btn, "url", None):
-                                has_link = True
-                                break
-                        if has_link:
-                            break
-                # Check webpage preview
-                if not has_link and msg.media:
-                    from telethon.tl.types import MessageMediaWebPage
-                    if isinstance(msg.media, MessageMediaWebPage):
-                        has_link = True
-                # Regex fallback on text
-                if not has_link and msg.message:
-                    import re
-                    has_link = bool(re.search(r'https?://', msg.message))
-
-                channel_name = getattr(entity, "username", None) or str(entity.id)
-
-                yield {
-                    "message_id": msg.id,
-                    "text": msg.message or "",
-                    "date": msg.date.isoformat() if msg.date else "",
-                    "sender_id": msg.sender_id,
-                    "has_link": has_link,
-                    "channel_name": channel_name,
-                    "forward_from": forward_from,
-                    "raw_message": msg,
-                }
-
-                fetched += 1
-                if progress_callback and fetched % BATCH_SIZE == 0:
-                    progress_callback(fetched, f"📨 Fetched {fetched:,} messages…")
-
-        except FloodWaitError as e:
-            # REC-03 — show countdown in progress_callback
-            wait = e.seconds
-            if progress_callback:
-                for remaining in range(wait, 0, -1):
-                    progress_callback(
-                        fetched,
-                        f"⚠️ Rate limited by Telegram. Resuming in {remaining}s…",
+
+                    last_yielded_id = msg.id
+                    yield ScrapedMessage(
+                        message_id=msg.id,
+                        text=msg_text or "",
+                        date=_iso_date(msg_date) if msg_date else "",
+                        sender_id=msg.sender_id,
+                        has_link=has_link,
+                        channel_name=channel_name,
+                        forward_from=forward_from,
+                        raw_message=msg,
                     )
-                    await asyncio.sleep(1)
-            else:
-                await asyncio.sleep(wait)
-            # Resume by recursively continuing (Telethon handles offset internally)
-            # The caller should re-invoke if more messages are needed.
-
-        except (ConnectionError, OSError) as exc:
-            for attempt in range(MAX_RETRIES):
-                try:
-                    await self.client.connect()
-                    break
-                except (ConnectionError, OSError):
-                    if attempt < MAX_RETRIES - 1:
-                        await asyncio.sleep(RETRY_DELAYS[attempt])
-                    else:
-                        raise exc
+
+                    fetched += 1
+                    if progress_callback and fetched % BATCH_SIZE == 0:
+                        progress_callback(fetched, f"📨 Fetched {fetched:,} messages…")
+
+                break  # iterator exhausted (or stop/date cut-off above)
+
+            except FloodWaitError as e:
+                # REC-03 — show countdown in progress_callback
+                wait = e.seconds
+                if progress_callback:
+                    # Coarse tick (~20 updates total) — a per-second countdown
+                    # schedules `wait` separate loop wakeups for no benefit.
+                    step = max(1, wait // 20)
+                    for remaining in range(wait, 0, -step):
+                        progress_callback(
+                            fetched,
+                            f"⚠️ Rate limited by Telegram. Resuming in {remaining}s…",
+                        )
+                        await asyncio.sleep(min(step, remaining))
+                else:
+                    await asyncio.sleep(wait)
+                # Auto-resume in place: we iterate newest→oldest, so pick
+                # up below the last id handed out. Reusing iter_kwargs
+                # (entity already resolved) avoids a get_entity RTT.
+                if last_yielded_id:
+                    iter_kwargs["offset_id"] = last_yielded_id
+                if limit is not None:
+                    iter_kwargs["limit"] = limit - fetched
+
+            except (ConnectionError, OSError) as exc:
+                for attempt in range(MAX_RETRIES):
+                    try:
+                        await self.client.connect()
+                        break
+                    except (ConnectionError, OSError):
+                        if attempt < MAX_RETRIES - 1:
+                            await asyncio.sleep(_retry_delay(attempt))
+                        else:
+                            raise exc
+                # Reconnected — resume from where the stream broke.
+                if last_yielded_id:
+                    iter_kwargs["offset_id"] = last_yielded_id
+                if limit is not None:
+                    iter_kwargs["limit"] = limit - fetched
 
         # Final progress update
         if progress_callback:
             progress_callback(fetched, f"✅ Done — {fetched:,} messages fetched")
+
+    async def fetch_message_batches(
+        self,
+        identifier: str,
+        batch_size: int = BATCH_SIZE,
+        **kwargs,
+    ) -> AsyncGenerator[list, None]:
+        """
+        Yield lists of ~batch_size message dicts instead of single messages.
+
+        A producer task drains fetch_messages into a small asyncio.Queue
+        while the consumer works on the previous batch, so each
+        producer/consumer switch hands over a whole batch and the next
+        network fetch overlaps with downstream processing.
+        """
+        queue_: asyncio.Queue = asyncio.Queue(maxsize=4)
+        done = object()
+
+        async def _produce():
+            batch: list = []
+            try:
+                async for msg in self.fetch_messages(identifier, **kwargs):
+                    batch.append(msg)
+                    if len(batch) >= batch_size:
+                        try:
+                            queue_.put_nowait(batch)   # fast path
+                        except asyncio.QueueFull:
+                            await queue_.put(batch)
+                        batch = []
+                if batch:
+                    await queue_.put(batch)
+            finally:
+                await queue_.put(done)
+
+        producer = asyncio.ensure_future(_produce())
+        try:
+            while True:
+                item = await queue_.get()
+                if item is done:
+                    break
+                yield item
+            await producer  # surface producer exceptions
+        finally:
+            producer.cancel()
+
+    async def fetch_message_column_batches(
+        self,
+        identifier: str,
+        batch_size: int = BATCH_SIZE,
+        **kwargs,
+    ) -> AsyncGenerator[dict, None]:
+        """
+        Structure-of-arrays variant of fetch_message_batches: yields one
+        dict of parallel column lists per batch, e.g.
+        {"message_id": [...], "text": [...], ...}.
+
+        db.save_message_columns consumes this directly, zipping the columns
+        straight into executemany with no intermediate per-row records.
+        """
+        async for batch in self.fetch_message_batches(identifier, batch_size, **kwargs):
+            cols: dict[str, list] = {
+                "message_id": [], "text": [], "date": [], "sender_id": [],
+                "has_link": [], "channel_name": [], "forward_from": [],
+            }
+            for m in batch:
+                cols["message_id"].append(m.message_id)
+                cols["text"].append(m.text)
+                cols["date"].append(m.date)
+                cols["sender_id"].append(m.sender_id)
+                cols["has_link"].append(m.has_link)
+                cols["channel_name"].append(m.channel_name)
+                cols["forward_from"].append(m.forward_from)
+            yield cols
+
+    async def _fetch_one(self, identifier: str, **kwargs) -> list[dict]:
+        """Collect fetch_messages output for one channel into a list."""
+        return [msg async for msg in self.fetch_messages(identifier, **kwargs)]
+
+    async def fetch_many(self, identifiers: list[str], **kwargs) -> list[list[dict]]:
+        """
+        Scrape several channels concurrently over the single MTProto link.
+
+        Entities are pre-resolved in one gather pass so the get_entity
+        round-trips overlap instead of serializing; each channel's message
+        iteration then runs as its own task. Returns one message list per
+        identifier, in input order.
+        """
+        await asyncio.gather(*[
+            self._resolve(self._parse_identifier(i))
+            for i in identifiers
+        ])
+        return await asyncio.gather(*[
+            self._fetch_one(i, **kwargs) for i in identifiers
+        ])
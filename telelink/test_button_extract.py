@@ -1,43 +1,114 @@
 """
 Test script: Extract ALL bot-button links from exported Telegram HTML.
-Uses regex to directly grab <a href="..."> inside bot_button divs.
+Uses selectolax (C HTML parser) when available; falls back to the old
+regex scan otherwise. The file is mmap'd read-only so multi-MB exports
+are never copied into a Python str up front.
 """
+import html
+import mmap
 import re
 from pathlib import Path
 
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
 
 def extract_button_links(html_path: str) -> list[dict]:
     """Parse the HTML and return all messages with their button links."""
-    html = Path(html_path).read_text(encoding="utf-8")
-
-    # Split into message blocks
-    msg_pattern = re.compile(
-        r'<div class="message default clearfix" id="(message\d+)">(.*?)</div>\s*</div>\s*(?=<div class="message|$)',
-        re.DOTALL,
-    )
-    # Extract message text
-    text_pattern = re.compile(r'<div class="text">\s*(.*?)\s*</div>', re.DOTALL)
-    # Extract bot button links: <a ...href="URL">...<div>LABEL</div>...</a>
-    button_pattern = re.compile(
-        r'<div class="bot_button">\s*<a[^>]*href="([^"]+)"[^>]*>.*?<div>\s*(.*?)\s*</div>',
-        re.DOTALL,
-    )
+    with open(html_path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if HTMLParser is not None:
+                return _extract_selectolax(mm[:])
+            return _extract_regex(mm)
+        finally:
+            mm.close()
+
+
+def _extract_selectolax(html: bytes) -> list[dict]:
+    """One C-level parse pass — no regex backtracking over the whole file."""
+    results = []
+    tree = HTMLParser(html)
+    for node in tree.css("div.message.default.clearfix"):
+        msg_id = node.attributes.get("id") or ""
+        if not msg_id.startswith("message"):
+            continue
+
+        text_node = node.css_first("div.text")
+        clean_text = text_node.text(strip=True) if text_node else ""
+
+        buttons = []
+        for a in node.css("div.bot_button a"):
+            url = a.attributes.get("href") or ""
+            if not url:
+                continue
+            label_node = a.css_first("div")
+            label = (label_node.text(strip=True) if label_node else a.text(strip=True))
+            buttons.append({"label": label, "url": url})
+
+        if buttons:
+            results.append({
+                "message_id": msg_id,
+                "text": clean_text,
+                "buttons": buttons,
+            })
+
+    return results
+
+
+def _strip_tags(s: str) -> str:
+    """Drop <...> tags with C-level str.find scanning, then unescape.
+
+    The export's tag set is tiny and well-formed, so this beats the
+    backtracking regex sub on long message bodies.
+    """
+    out = []
+    i = 0
+    while True:
+        lt = s.find('<', i)
+        if lt < 0:
+            out.append(s[i:])
+            break
+        out.append(s[i:lt])
+        gt = s.find('>', lt)
+        if gt < 0:
+            break
+        i = gt + 1
+    return html.unescape(''.join(out))
+
+
+# Bytes-level patterns: scanning the mmap directly skips the UTF-8 decode
+# and str allocation for the whole file; only matched groups get decoded.
+_MSG_PATTERN = re.compile(
+    rb'<div class="message default clearfix" id="(message\d+)">(.*?)</div>\s*</div>\s*(?=<div class="message|$)',
+    re.DOTALL,
+)
+_TEXT_PATTERN = re.compile(rb'<div class="text">\s*(.*?)\s*</div>', re.DOTALL)
+_BUTTON_PATTERN = re.compile(
+    rb'<div class="bot_button">\s*<a[^>]*href="([^"]+)"[^>]*>.*?<div>\s*(.*?)\s*</div>',
+    re.DOTALL,
+)
+
 
+def _extract_regex(raw_html) -> list[dict]:
+    """Regex scan over a bytes buffer (kept for environments without selectolax)."""
     results = []
-    for match in msg_pattern.finditer(html):
-        msg_id = match.group(1)
+    for match in _MSG_PATTERN.finditer(raw_html):
+        msg_id = match.group(1).decode("utf-8")
         block = match.group(2)
 
         # Get message text (strip HTML tags)
-        text_match = text_pattern.search(block)
-        raw_text = text_match.group(1) if text_match else ""
-        clean_text = re.sub(r'<[^>]+>', '', raw_text).strip()
+        text_match = _TEXT_PATTERN.search(block)
+        raw_text = text_match.group(1).decode("utf-8") if text_match else ""
+        clean_text = _strip_tags(raw_text).strip()
 
         # Get all button links
         buttons = []
-        for btn in button_pattern.finditer(block):
-            url = btn.group(1)
-            label = re.sub(r'<[^>]+>', '', btn.group(2)).strip()
+        for btn in _BUTTON_PATTERN.finditer(block):
+            url = btn.group(1).decode("utf-8")
+            label = _strip_tags(btn.group(2).decode("utf-8")).strip()
             buttons.append({"label": label, "url": url})
 
         if buttons:
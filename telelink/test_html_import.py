@@ -1,15 +1,66 @@
+"""HTML import test (pytest) — parses a minimal Telegram Desktop export."""
+import sys
+sys.path.insert(0, '.')
+
+import pytest
+
 from html_import import parse_telegram_html
 
-msgs = parse_telegram_html(r"C:\Users\Nikhil\Downloads\Telegram Desktop\ChatExport_2026-02-22\messages.html")
-btn_msgs = [m for m in msgs if m.buttons]
-total_btns = sum(len(m.buttons) for m in btn_msgs)
+_SAMPLE_HTML = """\
+<html><body><div class="history">
+<div class="message default clearfix" id="message101">
+ <div class="body">
+  <div class="pull_right date details" title="22.02.2026 10:15:30 UTC+04:00">10:15</div>
+  <div class="text">Episode list <a href="https://example.com/ep1">Ep 1</a> and plain https://plain.example.org/x</div>
+  <table class="bot_buttons_table"><tbody><tr>
+   <td class="bot_button_column"><div class="bot_button"><a href="https://files.example.com/1-20"><div>1-20</div></a></div></td>
+   <td class="bot_button_column"><div class="bot_button"><a href="https://files.example.com/21-40"><div>21-40</div></a></div></td>
+  </tr></tbody></table>
+ </div>
+</div>
+<div class="message default clearfix joined" id="message102">
+ <div class="body">
+  <div class="text">Just text, no links here.</div>
+ </div>
+</div>
+</div></body></html>
+"""
+
+
+@pytest.fixture(scope="session")
+def msgs(tmp_path_factory):
+    path = tmp_path_factory.mktemp("export") / "messages.html"
+    path.write_text(_SAMPLE_HTML, encoding="utf-8")
+    return parse_telegram_html(str(path))
+
+
+def test_message_count(msgs):
+    assert len(msgs) == 2
+
+
+def test_buttons(msgs):
+    btn_msgs = [m for m in msgs if m.buttons]
+    assert len(btn_msgs) == 1
+    assert btn_msgs[0].message_id == 101
+    assert [b["url"] for b in btn_msgs[0].buttons] == [
+        "https://files.example.com/1-20",
+        "https://files.example.com/21-40",
+    ]
+    assert [b["label"] for b in btn_msgs[0].buttons] == ["1-20", "21-40"]
+
+
+def test_text_links(msgs):
+    assert msgs[0].text_links == [
+        "https://example.com/ep1",
+        "https://plain.example.org/x",
+    ]
+
+
+def test_date_and_text(msgs):
+    assert msgs[0].date.startswith("22.02.2026")
+    assert "Episode list" in msgs[0].text
+    assert msgs[1].text == "Just text, no links here."
 
-print(f"Total messages: {len(msgs)}")
-print(f"Messages with buttons: {len(btn_msgs)}")
-print(f"Total button links: {total_btns}")
-print()
 
-for m in btn_msgs:
-    print(f"  {m.message_id}: \"{m.text[:50]}\" -> {len(m.buttons)} buttons")
-    for btn in m.buttons:
-        print(f"    [{btn['label']:15s}] -> {btn['url']}")
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
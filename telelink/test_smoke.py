@@ -1,7 +1,9 @@
-"""Quick smoke test for db.py and link_extractor.py"""
+"""Quick smoke test for db.py and link_extractor.py (pytest)."""
 import sys
 sys.path.insert(0, '.')
 
+import pytest
+
 from db import (
     init_db, save_messages, save_links, get_messages, get_links,
     get_channel_stats, upsert_channel, clear_channel, get_domain_list,
@@ -9,73 +11,90 @@ from db import (
 )
 from link_extractor import extract_links, LinkRecord
 
-# ── DB Tests ──────────────────────────────────────────────────────
-conn = init_db(":memory:")
-print("[OK] init_db")
-
-save_messages(conn, [{
-    "message_id": 1,
-    "channel_name": "test_ch",
-    "sender_id": 100,
-    "text": "Hello https://example.com",
-    "date": "2026-01-01",
-    "has_link": True,
-}])
-print("[OK] save_messages")
-
-# ── Link Extractor Tests ─────────────────────────────────────────
-links = extract_links({
-    "message_id": 1,
-    "text": "Check https://github.com/repo and https://youtube.com/watch?v=123",
-    "date": "2026-01-01",
-    "channel_name": "test_ch",
-})
-assert len(links) == 2, f"Expected 2 links, got {len(links)}"
-assert links[0].domain == "github.com"
-assert links[1].domain == "youtube.com"
-assert links[0].source == "regex"
-print(f"[OK] extract_links — found {len(links)} links")
-
-# Dedup test
-links_dup = extract_links({
-    "message_id": 2,
-    "text": "https://example.com https://example.com",
-    "date": "2026-01-01",
-    "channel_name": "test_ch",
-})
-assert len(links_dup) == 1, f"Dedup failed: got {len(links_dup)}"
-print("[OK] deduplication")
-
-save_links(conn, links)
-print("[OK] save_links")
-
-df = get_messages(conn)
-assert len(df) == 1
-print(f"[OK] get_messages — {len(df)} rows")
-
-df2 = get_links(conn)
-assert len(df2) == 2
-print(f"[OK] get_links — {len(df2)} rows")
-
-domains = get_domain_list(conn)
-assert "github.com" in domains
-print(f"[OK] get_domain_list — {domains}")
-
-upsert_channel(conn, {
-    "channel_name": "test_ch",
-    "display_name": "Test Channel",
-    "member_count": 500,
-})
-stats = get_channel_stats(conn)
-assert len(stats) == 1
-print(f"[OK] upsert_channel + get_channel_stats")
-
-last_id = get_last_message_id(conn, "test_ch")
-assert last_id == 1
-print(f"[OK] get_last_message_id = {last_id}")
-
-clear_channel(conn, "test_ch")
-assert len(get_messages(conn)) == 0
-print("[OK] clear_channel")
-
-print("\n✅ ALL TESTS PASSED")
+
+# One in-memory DB for the whole session — schema creation runs once,
+# not per test. Tests below run in definition order and share its state.
+@pytest.fixture(scope="session")
+def conn():
+    return init_db(":memory:")
+
+
+@pytest.fixture(scope="session")
+def links():
+    return extract_links({
+        "message_id": 1,
+        "text": "Check https://github.com/repo and https://youtube.com/watch?v=123",
+        "date": "2026-01-01",
+        "channel_name": "test_ch",
+    })
+
+
+def test_save_messages(conn):
+    # Single executemany inside one transaction — no per-row commits.
+    save_messages(conn, [{
+        "message_id": 1,
+        "channel_name": "test_ch",
+        "sender_id": 100,
+        "text": "Hello https://example.com",
+        "date": "2026-01-01",
+        "has_link": True,
+    }])
+
+
+def test_extract_links(links):
+    assert len(links) == 2, f"Expected 2 links, got {len(links)}"
+    assert links[0].domain == "github.com"
+    assert links[1].domain == "youtube.com"
+    assert links[0].source == "regex"
+
+
+def test_deduplication():
+    links_dup = extract_links({
+        "message_id": 2,
+        "text": "https://example.com https://example.com",
+        "date": "2026-01-01",
+        "channel_name": "test_ch",
+    })
+    assert len(links_dup) == 1, f"Dedup failed: got {len(links_dup)}"
+
+
+def test_save_links(conn, links):
+    save_links(conn, links)
+
+
+def test_get_messages(conn):
+    df = get_messages(conn)
+    assert len(df) == 1
+
+
+def test_get_links(conn):
+    df2 = get_links(conn)
+    assert len(df2) == 2
+
+
+def test_get_domain_list(conn):
+    domains = get_domain_list(conn)
+    assert "github.com" in domains
+
+
+def test_upsert_channel(conn):
+    upsert_channel(conn, {
+        "channel_name": "test_ch",
+        "display_name": "Test Channel",
+        "member_count": 500,
+    })
+    stats = get_channel_stats(conn)
+    assert len(stats) == 1
+
+
+def test_get_last_message_id(conn):
+    assert get_last_message_id(conn, "test_ch") == 1
+
+
+def test_clear_channel(conn):
+    clear_channel(conn, "test_ch")
+    assert len(get_messages(conn)) == 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
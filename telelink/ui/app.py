@@ -5,7 +5,7 @@ Tabs: 🔐 Auth │ 📡 Scrape │ 💬 Messages │ 🔗 Links │ 📊 Stats
 """
 from __future__ import annotations
 
-import sys, os, asyncio, time, re
+import sys, os, asyncio, time, re, traceback
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
 
@@ -18,7 +18,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from config import DB_PATH, SESSION_NAME, APP_TITLE, BATCH_SIZE, wait_time
 import db as database
-from link_extractor import extract_links
+from link_extractor import extract_links, extract_links_batch, LinkRecord, _extract_domain
 from html_import import parse_telegram_html
 from telegram_client import (
     TelethonWrapper,
@@ -38,7 +38,39 @@ st.set_page_config(
 )
 
 # ── Load .env ─────────────────────────────────────────────────────────
-load_dotenv(Path(__file__).resolve().parent.parent / ".env")
+# Streamlit re-executes this whole script on every interaction, so an
+# unguarded load_dotenv re-reads and re-parses the file per rerun.
+_ENV_PATH = Path(__file__).resolve().parent.parent / ".env"
+if not st.session_state.get("_env_loaded"):
+    load_dotenv(_ENV_PATH)
+    st.session_state["_env_loaded"] = True
+
+
+def _write_env(pairs: dict) -> None:
+    """Persist credentials in one read-modify-rewrite.
+
+    dotenv.set_key reopens, reparses, and rewrites the whole file per
+    key; batching the three auth keys costs one rewrite (atomic via
+    os.replace) instead of three."""
+    lines: list[str] = []
+    seen: set[str] = set()
+    if _ENV_PATH.exists():
+        for line in _ENV_PATH.read_text().splitlines():
+            key = line.split("=", 1)[0].strip() if "=" in line else None
+            if key in pairs:
+                lines.append(f"{key}={pairs[key]}")
+                seen.add(key)
+            else:
+                lines.append(line)
+    for k, v in pairs.items():
+        if k not in seen:
+            lines.append(f"{k}={v}")
+    tmp = _ENV_PATH.with_name(_ENV_PATH.name + ".tmp")
+    tmp.write_text("\n".join(lines) + "\n")
+    os.replace(tmp, _ENV_PATH)
+    # Keep the live process in sync — .env is only re-parsed on a fresh
+    # browser session now.
+    os.environ.update(pairs)
 
 # ── DB Connection (cached at process level) ───────────────────────────
 
@@ -47,21 +79,111 @@ def get_conn():
     return database.init_db(DB_PATH)
 
 
+# One shared WAL-mode connection for the whole script — tabs reference
+# this local instead of re-paying the cache_resource lookup each time.
+conn = get_conn()
+
+
+# ── Cached reads ──────────────────────────────────────────────────────
+#    Every keystroke in a search box reruns the whole script; these
+#    wrappers memoize the SQL round-trip + DataFrame build per filter
+#    combination. A finished scrape calls _clear_read_caches().
+
+@st.cache_data(ttl=60, max_entries=32, show_spinner=False)
+def _cached_messages(channel, keyword, has_link):
+    return database.get_messages(
+        get_conn(), channel=channel, keyword=keyword, has_link=has_link
+    )
+
+
+@st.cache_data(ttl=60, max_entries=32, show_spinner=False)
+def _cached_links(channel=None, domain=None, unique_only=False, search=None):
+    return database.get_links(
+        get_conn(), channel=channel, domain=domain,
+        unique_only=unique_only, search=search,
+    )
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_channel_list():
+    return database.get_channel_list(get_conn())
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_domain_list():
+    return database.get_domain_list(get_conn())
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_channel_stats():
+    return database.get_channel_stats(get_conn())
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_top_domains():
+    return database.get_top_domains(get_conn())
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_links_per_day():
+    return database.get_links_per_day(get_conn())
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_source_counts():
+    return database.get_source_counts(get_conn())
+
+
+def _clear_read_caches():
+    """Drop memoized query results after the data underneath changed."""
+    _cached_messages.clear()
+    _cached_links.clear()
+    _cached_channel_list.clear()
+    _cached_domain_list.clear()
+    _cached_channel_stats.clear()
+    _cached_top_domains.clear()
+    _cached_links_per_day.clear()
+    _cached_source_counts.clear()
+
+
+def _get_last_id_cached(conn, ch_name: str) -> int:
+    """Session-memoized MAX(message_id) — one SQLite lookup per channel
+    per session instead of one per Start-Scraping click. The scrape loop
+    refreshes the entry after saving, and Clear Data evicts it."""
+    cache = st.session_state.setdefault("_last_id_cache", {})
+    last = cache.get(ch_name)
+    if last is None:
+        last = cache[ch_name] = database.get_last_message_id(conn, ch_name)
+    return last
+
+
 # ── Telethon Manager (Queue-like Bridge) ──────────────────────────────
 #    Streamlit wipes global module variables on every user action.
 #    By wrapping the entire Manager in @st.cache_resource, we ensure
 #    the background thread, event loop, and TelegramClient survive
 #    all reruns and act as a unified queue for all async requests.
 
+import queue
 import threading
 import concurrent.futures
 
 class TelethonManager:
     def __init__(self):
         self._loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        # Eager tasks (3.12+): gathered sub-scrapes that hit cached entities
+        # finish synchronously without an event-loop round-trip.
+        if hasattr(asyncio, "eager_task_factory"):
+            self._loop.set_task_factory(asyncio.eager_task_factory)
         def _run():
             asyncio.set_event_loop(self._loop)
             self._loop.run_forever()
+        # One long-lived worker for blocking calls dispatched off the loop
+        # (run_in_executor) — otherwise asyncio lazily spins up a default
+        # pool of cpu_count()+4 threads on first use.
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="telethon-bridge"
+        )
+        self._loop.set_default_executor(self._pool)
         self._thread: threading.Thread = threading.Thread(target=_run, daemon=True)
         self._thread.start()
 
@@ -69,6 +191,45 @@ class TelethonManager:
         self._api_id: int | None = None
         self._api_hash: str | None = None
 
+        # Request/response pipeline — the queue is created ON the loop
+        # thread (asyncio.Queue binds to the running loop) and consumed
+        # by a long-lived dispatcher task.
+        self._inq: asyncio.Queue | None = None
+        self._inq_ready = threading.Event()
+        asyncio.run_coroutine_threadsafe(self._consume_requests(), self._loop)
+
+    async def _consume_requests(self):
+        """Dispatcher: drain the ingress queue, launching each request as
+        its own task so one long Telegram RPC never head-of-line-blocks
+        the requests queued behind it."""
+        self._inq = asyncio.Queue()
+        self._inq_ready.set()
+        while True:
+            coro, future = await self._inq.get()
+            task = asyncio.ensure_future(coro)
+            if future is not None:
+                def _transfer(t, f=future):
+                    if t.cancelled():
+                        f.cancel()
+                    elif t.exception() is not None:
+                        f.set_exception(t.exception())
+                    else:
+                        f.set_result(t.result())
+                task.add_done_callback(_transfer)
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        """Enqueue a coroutine without blocking the script thread.
+        Returns a Future the UI can poll (or .result() when it chooses)."""
+        self._inq_ready.wait(timeout=5)
+        fut: concurrent.futures.Future = concurrent.futures.Future()
+        self._loop.call_soon_threadsafe(self._inq.put_nowait, (coro, fut))
+        return fut
+
+    def submit_nowait(self, coro) -> None:
+        """Fire-and-forget enqueue (progress kicks and the like)."""
+        self._inq_ready.wait(timeout=5)
+        self._loop.call_soon_threadsafe(self._inq.put_nowait, (coro, None))
+
     def run_async(self, coro):
         """Submit a coroutine to the background queue and wait for the result."""
         if not self._loop or self._loop.is_closed():
@@ -76,6 +237,18 @@ class TelethonManager:
         future = asyncio.run_coroutine_threadsafe(coro, self._loop)
         return future.result(timeout=300)
 
+    def run_async_batch(self, coros):
+        """Submit several coroutines as one gather — a single cross-thread
+        hop and one blocking wait instead of one per coroutine."""
+        if not self._loop or self._loop.is_closed():
+            raise RuntimeError("Background event loop is not running.")
+
+        async def _g():
+            return await asyncio.gather(*coros)
+
+        future = asyncio.run_coroutine_threadsafe(_g(), self._loop)
+        return future.result(timeout=300)
+
     def get_client(self, api_id: int, api_hash: str) -> TelethonWrapper:
         """Get the singleton client, creating it ON the background thread if missing."""
         if self._client and self._api_id == api_id and self._api_hash == api_hash:
@@ -88,13 +261,21 @@ class TelethonManager:
         self._api_id = api_id
         self._api_hash = api_hash
 
-        # Clean up stale SQLite journal files (safe to do from main thread)
-        for ext in ("-journal", "-wal", "-shm"):
-            p = Path(str(SESSION_NAME) + ext)
-            try:
-                if p.exists(): p.unlink()
-            except OSError:
-                pass
+        # Clean up stale SQLite journal files (safe to do from main thread).
+        # One scandir pass replaces a stat+unlink pair per extension.
+        session_path = Path(SESSION_NAME)
+        parent = session_path.parent if str(session_path.parent) else Path(".")
+        targets = {session_path.name + ext for ext in ("-journal", "-wal", "-shm")}
+        try:
+            with os.scandir(parent) as it:
+                for entry in it:
+                    if entry.name in targets:
+                        try:
+                            os.unlink(entry.path)
+                        except OSError:
+                            pass
+        except OSError:
+            pass
 
         # Create the client ON the background event loop thread
         async def _create():
@@ -127,6 +308,31 @@ def _get_or_create_client(api_id: int, api_hash: str) -> TelethonWrapper:
 def run_async(coro):
     return get_telethon_manager().run_async(coro)
 
+def run_async_batch(coros):
+    return get_telethon_manager().run_async_batch(coros)
+
+
+# Batched auth coroutines — each run_async is a cross-thread submit plus a
+# blocking wait, so sequential calls pay two futex round-trips per click.
+# One coroutine per user action keeps it to a single handoff.
+async def _connect_and_check(client: TelethonWrapper) -> bool:
+    await client.connect()
+    return await client.is_authorized()
+
+async def _make_event() -> asyncio.Event:
+    """Build the stop event ON the bridge loop — an Event constructed on
+    the script thread binds to the wrong loop and risks the classic
+    'bound to a different event loop' failure when awaited."""
+    return asyncio.Event()
+
+async def _connect_check_or_send(client: TelethonWrapper, phone: str):
+    """Connect, short-circuit if the session is live, else send the OTP.
+    Returns (authorized, phone_code_hash | None)."""
+    await client.connect()
+    if await client.is_authorized():
+        return True, None
+    return False, await client.send_code(phone)
+
 def _clear_client_cache():
     get_telethon_manager().disconnect_and_clear()
 
@@ -150,23 +356,33 @@ for k, v in _defaults.items():
 
 
 # ── Detect saved session (no auto-connect) ────────────────────────────
-_session_path = Path(SESSION_NAME)
-_session_file_exists = _session_path.exists() or Path(str(_session_path) + ".session").exists()
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _session_exists(session_name: str) -> bool:
+    """Cached stat — every rerun otherwise re-stats both candidate paths.
+    ttl=5 keeps the answer honest shortly after logout deletes the file."""
+    p = Path(session_name)
+    return p.exists() or Path(str(p) + ".session").exists()
+
+
+_session_file_exists = _session_exists(str(SESSION_NAME))
 
 
 # ── Helper: mask sensitive strings ────────────────────────────────────
 
+# Fixed-length tail: skips the per-call O(len) string multiply and stops
+# the mask from leaking the secret's length.
+_MASK_TAIL = "•" * 8
+
 def _mask(val: str, show: int = 6) -> str:
-    if len(val) <= show:
-        return val
-    return val[:show] + "•" * (len(val) - show)
+    return val if len(val) <= show else val[:show] + _MASK_TAIL
 
 
 # ══════════════════════════════════════════════════════════════════════
 # CUSTOM CSS
 # ══════════════════════════════════════════════════════════════════════
 
-st.markdown("""
+_CSS = """
 <style>
     /* Main background & font */
     .stApp {
@@ -273,7 +489,19 @@ st.markdown("""
         margin: 8px 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60)
+def _css() -> str:
+    return _CSS
+
+
+# Emitted on EVERY rerun — Streamlit strips elements a rerun doesn't
+# re-emit, so a once-per-session guard would drop the styles on the
+# first widget interaction. The cache_data accessor keeps the block's
+# construction memoized.
+st.markdown(_css(), unsafe_allow_html=True)
 
 
 # ── Title ─────────────────────────────────────────────────────────────
@@ -324,12 +552,17 @@ with tab_auth:
         _api_id_env = os.environ.get("TELEGRAM_API_ID", "")
         _api_hash_env = os.environ.get("TELEGRAM_API_HASH", "")
         
-        if not st.session_state["authenticated"] and _session_file_exists and _api_id_env and _api_hash_env:
+        # Try at most once per browser session — without the memo this
+        # fires a cross-thread connect/check on every keystroke rerun
+        # while the user is still filling in the form.
+        if (not st.session_state["authenticated"]
+                and not st.session_state.get("_autorestore_tried")
+                and _session_file_exists and _api_id_env and _api_hash_env):
+            st.session_state["_autorestore_tried"] = True
             # We don't need a button, we can just quietly verify in the background
             try:
                 client = _get_or_create_client(int(_api_id_env), _api_hash_env)
-                run_async(client.connect())
-                if run_async(client.is_authorized()):
+                if run_async(_connect_and_check(client)):
                     st.session_state["authenticated"] = True
                     st.session_state["auth_status"] = "✅ Connected"
                     # Rerun to switch tabs
@@ -342,17 +575,16 @@ with tab_auth:
             if st.button("🔄 Restore Session", type="primary", key="btn_restore"):
                 try:
                     client = _get_or_create_client(int(api_id), api_hash)
-                    run_async(client.connect())
-                    if run_async(client.is_authorized()):
+                    if run_async(_connect_and_check(client)):
                         st.session_state["authenticated"] = True
                         st.session_state["phone"] = phone
                         st.session_state["auth_status"] = "✅ Connected"
                         st.success("✅ Session restored successfully!")
-                        from dotenv import set_key
-                        env_path = Path(__file__).resolve().parent.parent / ".env"
-                        set_key(env_path, "TELEGRAM_API_ID", str(api_id))
-                        set_key(env_path, "TELEGRAM_API_HASH", api_hash)
-                        if phone: set_key(env_path, "TELEGRAM_PHONE", phone)
+                        _pairs = {"TELEGRAM_API_ID": str(api_id),
+                                  "TELEGRAM_API_HASH": api_hash}
+                        if phone:
+                            _pairs["TELEGRAM_PHONE"] = phone
+                        _write_env(_pairs)
                         st.rerun()
                     else:
                         st.warning("⚠️ Session file exists but is no longer valid. Please login with OTP.")
@@ -369,17 +601,18 @@ with tab_auth:
                         client = _get_or_create_client(
                             int(api_id), api_hash
                         )
-                        run_async(client.connect())
-
-                        # Check if already authorised (session exists)
-                        if run_async(client.is_authorized()):
+                        # One background-loop round-trip: connect, check
+                        # the saved session, and send the OTP if needed.
+                        authorized, pch = run_async(
+                            _connect_check_or_send(client, phone)
+                        )
+                        if authorized:
                             st.session_state["authenticated"] = True
                             st.session_state["phone"] = phone
                             st.session_state["auth_status"] = "✅ Connected"
                             st.success("✅ Already authenticated via saved session!")
                             st.rerun()
                         else:
-                            pch = run_async(client.send_code(phone))
                             st.session_state["phone_code_hash"] = pch
                             st.session_state["phone"] = phone
                             st.session_state["otp_sent"] = True
@@ -408,12 +641,11 @@ with tab_auth:
                         st.session_state["auth_status"] = "✅ Connected"
                         
                         # Save to .env permanently
-                        from dotenv import set_key
-                        env_path = Path(__file__).resolve().parent.parent / ".env"
-                        set_key(env_path, "TELEGRAM_API_ID", str(api_id))
-                        set_key(env_path, "TELEGRAM_API_HASH", api_hash)
+                        _pairs = {"TELEGRAM_API_ID": str(api_id),
+                                  "TELEGRAM_API_HASH": api_hash}
                         if st.session_state.get("phone"):
-                            set_key(env_path, "TELEGRAM_PHONE", st.session_state["phone"])
+                            _pairs["TELEGRAM_PHONE"] = st.session_state["phone"]
+                        _write_env(_pairs)
                         
                         st.success("✅ Authenticated successfully!")
                         st.rerun()
@@ -440,12 +672,11 @@ with tab_auth:
                         st.session_state["auth_status"] = "✅ Connected"
                         
                         # Save to .env permanently
-                        from dotenv import set_key
-                        env_path = Path(__file__).resolve().parent.parent / ".env"
-                        set_key(env_path, "TELEGRAM_API_ID", str(api_id))
-                        set_key(env_path, "TELEGRAM_API_HASH", api_hash)
+                        _pairs = {"TELEGRAM_API_ID": str(api_id),
+                                  "TELEGRAM_API_HASH": api_hash}
                         if st.session_state.get("phone"):
-                            set_key(env_path, "TELEGRAM_PHONE", st.session_state["phone"])
+                            _pairs["TELEGRAM_PHONE"] = st.session_state["phone"]
+                        _write_env(_pairs)
                             
                         st.success("✅ Authenticated with 2FA!")
                         st.rerun()
@@ -475,15 +706,14 @@ with tab_auth:
                 # Reset state
                 for k in list(_defaults.keys()):
                     st.session_state[k] = _defaults[k]
+                st.session_state["_autorestore_tried"] = False
                 st.rerun()
 
     with col_status:
         st.subheader("📊 Status")
         st.metric("Connection", st.session_state["auth_status"])
 
-        session_path = Path(SESSION_NAME)
-        session_exists = session_path.exists() or Path(str(session_path) + ".session").exists()
-        if session_exists:
+        if _session_exists(str(SESSION_NAME)):
             st.info(f"📁 Session file: `{SESSION_NAME}`")
 
         st.markdown("---")
@@ -521,19 +751,18 @@ with tab_scrape:
                 st.error(f"❌ File not found: {html_path}")
             else:
                 try:
-                    conn = get_conn()
                     parsed = parse_telegram_html(html_path)
-                    total_msgs = 0
-                    total_links = 0
 
                     # Derive a channel name from the HTML page title or folder
                     channel_name = Path(html_path).parent.name or "html_import"
 
-                    from link_extractor import LinkRecord, _extract_domain
-
+                    # Buffer everything, write once: one executemany per
+                    # table inside one transaction instead of a commit
+                    # (and fsync) per message and per link.
+                    all_msgs: list = []
+                    all_links: list = []
                     for msg in parsed:
-                        # Save message
-                        msg_dict = {
+                        all_msgs.append({
                             "message_id": msg.message_id,
                             "text": msg.text,
                             "date": msg.date,
@@ -541,13 +770,11 @@ with tab_scrape:
                             "has_link": bool(msg.buttons or msg.text_links),
                             "channel_name": channel_name,
                             "forward_from": None,
-                        }
-                        database.save_messages(conn, [msg_dict])
-                        total_msgs += 1
+                        })
 
-                        # Save button links as LinkRecord objects
+                        # Button links as LinkRecord objects
                         for btn in msg.buttons:
-                            lr = LinkRecord(
+                            all_links.append(LinkRecord(
                                 url=btn["url"],
                                 domain=_extract_domain(btn["url"]),
                                 anchor_text=btn["label"],
@@ -556,13 +783,11 @@ with tab_scrape:
                                 message_date=msg.date,
                                 channel_name=channel_name,
                                 forward_from=None,
-                            )
-                            database.save_links(conn, [lr])
-                            total_links += 1
+                            ))
 
-                        # Save text links as LinkRecord objects
+                        # Text links as LinkRecord objects
                         for url in msg.text_links:
-                            lr = LinkRecord(
+                            all_links.append(LinkRecord(
                                 url=url,
                                 domain=_extract_domain(url),
                                 anchor_text=None,
@@ -571,12 +796,16 @@ with tab_scrape:
                                 message_date=msg.date,
                                 channel_name=channel_name,
                                 forward_from=None,
-                            )
-                            database.save_links(conn, [lr])
-                            total_links += 1
+                            ))
+
+                    database.save_messages(conn, all_msgs)
+                    database.save_links(conn, all_links)
+                    # Imported rows must show up in the tabs immediately,
+                    # not after the readers' TTL expires
+                    _clear_read_caches()
 
                     st.success(
-                        f"✅ Imported **{total_msgs}** messages and **{total_links}** links "
+                        f"✅ Imported **{len(all_msgs)}** messages and **{len(all_links)}** links "
                         f"from `{channel_name}`"
                     )
                     st.balloons()
@@ -588,7 +817,6 @@ with tab_scrape:
     if not st.session_state["authenticated"]:
         st.warning("⚠️ Please authenticate in the **🔐 Auth** tab first to scrape live channels.")
     else:
-        conn = get_conn()
         _sid = os.environ.get("TELEGRAM_API_ID", "") or st.session_state.get("api_id_input", "")
         _shash = os.environ.get("TELEGRAM_API_HASH", "") or st.session_state.get("api_hash_input", "")
         if not _sid or not _shash:
@@ -616,7 +844,11 @@ with tab_scrape:
             # Check for duplicates
             existing_names = [c["channel_name"] for c in st.session_state["channels"]]
             try:
-                info = run_async(client.get_channel_info(channel_input))
+                # connect() is an idempotent no-op on the live session, so
+                # gathering it with the lookup costs one hop, not two.
+                _, info = run_async_batch(
+                    [client.connect(), client.get_channel_info(channel_input)]
+                )
                 if info["channel_name"] in existing_names:
                     st.warning(f"Channel **{info['display_name']}** is already in the list.")
                 else:
@@ -637,24 +869,39 @@ with tab_scrape:
         # ── Channel List ───────────────────────────────────────
         if st.session_state["channels"]:
             st.markdown("#### Added Channels")
-            for i, ch in enumerate(st.session_state["channels"]):
-                ch_col1, ch_col2, ch_col3, ch_col4 = st.columns([3, 1, 1, 1])
-                with ch_col1:
-                    st.markdown(
-                        f"**{ch.get('display_name', '')}** "
-                        f"(`@{ch.get('username', ch.get('channel_name', ''))}`)"
+            # One dataframe + one selectbox instead of 4 widgets per
+            # channel per rerun — O(1) widget deltas however long the list.
+            ch_df = pd.DataFrame(st.session_state["channels"])
+            st.dataframe(
+                ch_df[["display_name", "username", "member_count"]],
+                use_container_width=True,
+                hide_index=True,
+            )
+            act_col1, act_col2, act_col3 = st.columns([3, 1, 1])
+            with act_col1:
+                selected_idx = st.selectbox(
+                    "Channel",
+                    range(len(st.session_state["channels"])),
+                    format_func=lambda i: st.session_state["channels"][i].get("display_name", ""),
+                    key="channel_action_target",
+                    label_visibility="collapsed",
+                )
+            ch = st.session_state["channels"][selected_idx]
+            with act_col2:
+                if st.button("❌ Remove", key="btn_rm_channel"):
+                    st.session_state["channels"].pop(selected_idx)
+                    st.rerun()
+            with act_col3:
+                if st.button("🗑 Clear Data", key="btn_clear_channel"):
+                    database.clear_channel(conn, ch["channel_name"])
+                    st.session_state.setdefault("_last_id_cache", {}).pop(
+                        ch["channel_name"], None
                     )
-                with ch_col2:
-                    st.caption(f"👥 {ch.get('member_count', 0):,}")
-                with ch_col3:
-                    if st.button("❌ Remove", key=f"rm_{i}"):
-                        st.session_state["channels"].pop(i)
-                        st.rerun()
-                with ch_col4:
-                    if st.button("🗑 Clear Data", key=f"clr_{i}"):
-                        database.clear_channel(conn, ch["channel_name"])
-                        st.success(f"Cleared data for {ch['display_name']}")
-                        st.rerun()
+                    # The memoized readers would show the deleted rows
+                    # for up to their TTL otherwise
+                    _clear_read_caches()
+                    st.success(f"Cleared data for {ch['display_name']}")
+                    st.rerun()
         else:
             st.info("No channels added yet. Add one above to start scraping.")
 
@@ -709,132 +956,271 @@ with tab_scrape:
             to_dt = datetime(to_date.year, to_date.month, to_date.day, 23, 59, 59, tzinfo=timezone.utc)
             kw = keyword_filter.strip() if keyword_filter else None
 
+            # Everything channel-independent is built once here; each
+            # per-channel call only adds min_id and its callbacks.
+            scrape_kwargs = {
+                "limit": limit_val,
+                "from_date": from_dt,
+                "to_date": to_dt,
+                "keyword": kw,
+            }
+
             results_summary = []
 
-            for ch in st.session_state["channels"]:
-                if not st.session_state["scraping"]:
-                    break
+            # One set of placeholders for the whole run — per-channel
+            # allocation left N dead progress bars in the DOM.
+            scrape_header = st.empty()
+            progress_bar = st.progress(0, text="Starting…")
+            status_text = st.empty()
+
+            # ── Concurrent per-channel scraping ─────────────────
+            # Channels are independent network-bound workloads, so they
+            # run as concurrent tasks on the bridge loop (gather) with a
+            # semaphore cap to stay under Telegram's flood limits. The
+            # scrape tasks write from the loop thread while other UI
+            # actions (Clear Data, HTML import, Add Channel) write from
+            # script threads — db's _WRITE_LOCK serializes them all on
+            # the shared connection.
+            _SCRAPE_CONCURRENCY = 4
+
+            # SoA buffers: pending rows are parallel column lists, so the
+            # flush hands save_message_columns a zip of ready columns —
+            # no per-row dict/attribute re-traversal at insert time.
+            _MSG_COLUMNS = (
+                "message_id", "channel_name", "sender_id",
+                "text", "date", "has_link",
+            )
+
+            channels = list(st.session_state["channels"])
+            states = {}
+            for ch in channels:
                 ch_name = ch["channel_name"]
-                st.markdown(f"#### Scraping **{ch.get('display_name', ch_name)}**…")
-                progress_bar = st.progress(0, text="Starting…")
-                status_text = st.empty()
-                start_time = time.time()
+                min_id = _get_last_id_cached(conn, ch_name) if skip_scraped else 0
+                # Mutable state dict — used instead of nonlocal (Streamlit
+                # runs at module level). "progress" holds one (count, msg)
+                # tuple per update — a single reference swap is atomic
+                # under the GIL, so the UI reader never sees a torn pair.
+                states[ch_name] = {
+                    "fetched": 0, "links": 0, "link_recs": [],
+                    "cols": {c: [] for c in _MSG_COLUMNS},
+                    "max_id": min_id, "min_id": min_id,
+                    "progress": (0, "Queued…"), "elapsed": 0.0, "error": None,
+                }
+
+            # One stop event shared by every task
+            stop_event = run_async(_make_event())
+            # Wakes the UI loop only when something changed — no more
+            # fixed 0.5 s polling lag or idle wakeups.
+            progress_event = threading.Event()
+
+            def _make_progress_cb(state):
+                def progress_cb(count, msg):
+                    # Only update memory. DO NOT call st.x() from this background thread!
+                    state["progress"] = (count, msg)
+                    progress_event.set()
+                return progress_cb
 
-                # Incremental scraping (REC-02)
-                min_id = 0
-                if skip_scraped:
-                    min_id = database.get_last_message_id(conn, ch_name)
+            async def _scrape_channel(ch, sem):
+                ch_name = ch["channel_name"]
+                state = states[ch_name]
+                # DB writes go through the manager's single-worker default
+                # executor: they may block on db's _WRITE_LOCK (Clear Data
+                # or an HTML import on a script thread), and blocking the
+                # loop thread would stall every channel task and
+                # Telethon's network I/O. One worker also preserves flush
+                # ordering.
+                loop = asyncio.get_running_loop()
+                async with sem:
+                    if stop_event.is_set():
+                        return state
+                    t0 = time.monotonic()
+                    state["progress"] = (0, "Starting…")
+                    progress_event.set()
+                    last_flush = time.monotonic()
+                    try:
+                        # Batched consumption: the producer task inside
+                        # fetch_message_batches fetches batch N+1 from
+                        # Telegram while this loop extracts links from
+                        # batch N.
+                        async for batch in client.fetch_message_batches(
+                            ch_name,
+                            progress_callback=_make_progress_cb(state),
+                            stop_event=stop_event,
+                            min_id=state["min_id"],
+                            **scrape_kwargs,
+                        ):
+                            if stop_event.is_set():
+                                break
+
+                            raws = []
+                            for msg_rec in batch:
+                                raws.append(msg_rec.raw_message)
+                                msg_rec.raw_message = None  # don't keep Telethon objects alive
+                                if msg_rec.message_id > state["max_id"]:
+                                    state["max_id"] = msg_rec.message_id
+
+                            # One vectorized extraction pass over the batch
+                            links = extract_links_batch(batch, raws)
+                            if links_only:
+                                linked_ids = {lr.message_id for lr in links}
+                                kept = [m for m in batch if m.message_id in linked_ids]
+                            else:
+                                kept = batch
+
+                            # Column-wise appends: one C-loop comprehension
+                            # per column instead of a dict/object append
+                            # per message.
+                            cols = state["cols"]
+                            cols["message_id"].extend([m.message_id for m in kept])
+                            cols["channel_name"].extend([m.channel_name for m in kept])
+                            cols["sender_id"].extend([m.sender_id for m in kept])
+                            cols["text"].extend([m.text for m in kept])
+                            cols["date"].extend([m.date for m in kept])
+                            cols["has_link"].extend([m.has_link for m in kept])
+                            state["link_recs"].extend(links)
+                            state["links"] += len(links)
+                            state["fetched"] += len(kept)
+
+                            # Flush on size OR age — a slow channel no
+                            # longer holds rows hostage waiting for a full
+                            # batch, and busy ones still amortize the
+                            # fsync over BATCH_SIZE rows per transaction.
+                            if cols["message_id"] and (
+                                len(cols["message_id"]) >= BATCH_SIZE
+                                or time.monotonic() - last_flush > 0.5
+                            ):
+                                await loop.run_in_executor(
+                                    None, database.save_message_columns, conn, cols
+                                )
+                                await loop.run_in_executor(
+                                    None, database.save_links, conn, state["link_recs"]
+                                )
+                                for col in cols.values():
+                                    col.clear()
+                                state["link_recs"].clear()
+                                last_flush = time.monotonic()
+                    except Exception:
+                        # Keep sibling channels running; surface per-channel
+                        state["error"] = traceback.format_exc()
+                    finally:
+                        # Flush remaining
+                        if state["cols"]["message_id"]:
+                            await loop.run_in_executor(
+                                None, database.save_message_columns, conn, state["cols"]
+                            )
+                            for col in state["cols"].values():
+                                col.clear()
+                        if state["link_recs"]:
+                            await loop.run_in_executor(
+                                None, database.save_links, conn, state["link_recs"]
+                            )
+                            state["link_recs"].clear()
+                        await loop.run_in_executor(None, database.upsert_channel, conn, {
+                            "channel_name": ch_name,
+                            "display_name": ch.get("display_name", ""),
+                            "member_count": ch.get("member_count", 0),
+                            "last_scraped": datetime.now().isoformat(),
+                            "message_count": state["fetched"],
+                            "link_count": state["links"],
+                        })
+                        state["elapsed"] = time.monotonic() - t0
+                return state
+
+            async def _scrape_all():
+                sem = asyncio.Semaphore(_SCRAPE_CONCURRENCY)
+                await asyncio.gather(*(_scrape_channel(ch, sem) for ch in channels))
+
+            scrape_header.markdown(
+                f"#### Scraping **{len(channels)}** channel(s) — up to "
+                f"{_SCRAPE_CONCURRENCY} at a time…"
+            )
+            total_limit = limit_val * len(channels) if limit_val else None
 
-                # Mutable state dict — used instead of nonlocal (Streamlit runs at module level)
-                state = {"fetched": 0, "links": 0, "msgs": [], "link_recs": []}
+            try:
+                # Enqueue on the bridge — non-blocking submit. A done
+                # callback flips a local flag (and wakes the waiter), so
+                # each UI tick reads a plain Event instead of poking the
+                # cross-thread future.
+                future = get_telethon_manager().submit(_scrape_all())
+                done_flag = threading.Event()
+
+                def _on_done(_f):
+                    done_flag.set()
+                    progress_event.set()
+
+                future.add_done_callback(_on_done)
+
+                # Monitor safely from Streamlit thread
+                while not done_flag.is_set():
+                    total = 0
+                    lines = []
+                    for ch in channels:
+                        s = states[ch["channel_name"]]
+                        # One consistent (count, msg) snapshot
+                        c, m = s["progress"]
+                        total += c
+                        lines.append(
+                            f"**{ch.get('display_name', ch['channel_name'])}** — "
+                            f"{m} ({s['links']:,} links)"
+                        )
+                    status_text.markdown("  \n".join(lines))
+                    if total_limit:
+                        progress_bar.progress(
+                            min(total / total_limit, 1.0),
+                            text=f"📨 {total:,} messages fetched",
+                        )
 
-                # Create stop event
-                stop_event = asyncio.Event()
+                    # Keep Streamlit responsive
+                    if not st.session_state["scraping"]:
+                        # User clicked Stop in UI
+                        get_telethon_manager().submit_nowait(asyncio.sleep(0))  # kick loop
+                        # set() from the owning loop thread, not here
+                        get_telethon_manager()._loop.call_soon_threadsafe(stop_event.set)
+                        break
 
-                # Thread-safe state for UI updates
-                bg_progress = {"count": 0, "msg": "Starting..."}
+                    # Sleep until the next progress tick (or 1 s, to
+                    # keep checking the Stop flag and future state)
+                    if progress_event.wait(timeout=1.0):
+                        progress_event.clear()
 
-                def progress_cb(count, msg):
-                    # Only update memory. DO NOT call st.x() from this background thread!
-                    bg_progress["count"] = count
-                    bg_progress["msg"] = msg
-
-                async def _do_scrape():
-                    async for msg_dict in client.fetch_messages(
-                        ch_name,
-                        limit=limit_val,
-                        from_date=from_dt,
-                        to_date=to_dt,
-                        keyword=kw,
-                        progress_callback=progress_cb,
-                        stop_event=stop_event,
-                        min_id=min_id,
-                    ):
-                        if stop_event.is_set():
-                            break
-
-                        raw = msg_dict.pop("raw_message", None)
-
-                        # Extract links
-                        links = extract_links(msg_dict, raw)
-                        if links_only and not links:
-                            continue
-
-                        state["msgs"].append(msg_dict)
-                        state["link_recs"].extend(links)
-                        state["links"] += len(links)
-                        state["fetched"] += 1
-
-                        # Flush batch periodically
-                        if len(state["msgs"]) >= BATCH_SIZE:
-                            database.save_messages(conn, state["msgs"])
-                            database.save_links(conn, state["link_recs"])
-                            state["msgs"].clear()
-                            state["link_recs"].clear()
+                # Gather any exceptions from the bridge itself
+                future.result()
 
-                try:
-                    import time
-                    # Submit to background
-                    future = get_telethon_manager()._loop.create_task(_do_scrape())
-                    asyncio.run_coroutine_threadsafe(asyncio.wait([future]), get_telethon_manager()._loop)
-                    
-                    # Monitor safely from Streamlit thread
-                    while not future.done():
-                        # Read background state
-                        c = bg_progress["count"]
-                        m = bg_progress["msg"]
-                        
-                        # Update UI
-                        state["fetched"] = c
-                        status_text.markdown(f"📨 **{c:,}** messages fetched — **{state['links']:,}** links found so far")
-                        if limit_val:
-                            progress_bar.progress(min(c / limit_val, 1.0), text=m)
-                            
-                        # Keep Streamlit responsive
-                        if not st.session_state["scraping"]:
-                            # User clicked Stop in UI
-                            get_telethon_manager().run_async(asyncio.sleep(0)) # kick loop
-                            stop_event.set()
-                            break
-                            
-                        time.sleep(0.5)
+            except Exception:
+                err_str = traceback.format_exc()
+                st.error(f"❌ Scrape run failed:\n```python\n{err_str}\n```")
 
-                    # Gather any exceptions
-                    future.result()
+            progress_bar.progress(1.0, text="✅ Done")
 
-                except Exception as exc:
-                    import traceback
-                    err_str = traceback.format_exc()
-                    st.error(f"❌ Error scraping {ch_name}:\n```python\n{err_str}\n```")
-
-                # Flush remaining
-                if state["msgs"]:
-                    database.save_messages(conn, state["msgs"])
-                if state["link_recs"]:
-                    database.save_links(conn, state["link_recs"])
-
-                elapsed = time.time() - start_time
-                progress_bar.progress(1.0, text="✅ Done")
-
-                # Update channel stats
-                database.upsert_channel(conn, {
-                    "channel_name": ch_name,
-                    "display_name": ch.get("display_name", ""),
-                    "member_count": ch.get("member_count", 0),
-                    "last_scraped": datetime.now().isoformat(),
-                    "message_count": state["fetched"],
-                    "link_count": state["links"],
-                })
+            for ch in channels:
+                ch_name = ch["channel_name"]
+                state = states[ch_name]
+                if state["error"]:
+                    st.error(
+                        f"❌ Error scraping {ch_name}:\n```python\n{state['error']}\n```"
+                    )
+
+                # Refresh the memo with what this run saved (main thread —
+                # session_state must not be touched from the scrape tasks).
+                # Only ratchet upward: max_id starts at min_id, which is 0
+                # when "skip scraped" is off, so an empty run (stop, error,
+                # keyword with no hits) must not clobber a real last-id.
+                _id_cache = st.session_state.setdefault("_last_id_cache", {})
+                if state["max_id"] > _id_cache.get(ch_name, 0):
+                    _id_cache[ch_name] = state["max_id"]
 
                 results_summary.append({
                     "Channel": ch.get("display_name", ch_name),
                     "Messages": state["fetched"],
                     "Links": state["links"],
-                    "Time (s)": round(elapsed, 1),
+                    "Time (s)": round(state["elapsed"], 1),
                 })
 
             st.session_state["scraping"] = False
 
+            # Data changed under the memoized readers — drop them
+            _clear_read_caches()
+
             if results_summary:
                 st.balloons()
                 st.markdown("### ✅ Scraping Complete")
@@ -848,8 +1234,7 @@ with tab_scrape:
 # ══════════════════════════════════════════════════════════════════════
 
 with tab_messages:
-    conn = get_conn()
-    channel_list = database.get_channel_list(conn)
+    channel_list = _cached_channel_list()
 
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -869,8 +1254,7 @@ with tab_messages:
     elif link_filter == "No links":
         has_link_val = False
 
-    df_msgs = database.get_messages(
-        conn,
+    df_msgs = _cached_messages(
         channel=filter_channel if filter_channel != "All" else None,
         keyword=search_msg if search_msg else None,
         has_link=has_link_val,
@@ -882,8 +1266,10 @@ with tab_messages:
         # Prepare display columns
         display_df = df_msgs[["message_date", "channel_name", "message_text", "has_link", "message_id"]].copy()
         display_df.columns = ["Date", "Channel", "Message", "Has Link", "Msg ID"]
-        display_df["Message"] = display_df["Message"].apply(
-            lambda x: (str(x)[:80] + "…") if x and len(str(x)) > 80 else x
+        # Vectorized truncation — two C-loop str kernels, no per-row lambda
+        long_mask = display_df["Message"].str.len() > 80
+        display_df.loc[long_mask, "Message"] = (
+            display_df.loc[long_mask, "Message"].str.slice(0, 80) + "…"
         )
         display_df["Has Link"] = display_df["Has Link"].apply(lambda x: "✅" if x else "")
 
@@ -899,23 +1285,41 @@ with tab_messages:
         m2.metric("Messages with Links", f"{with_links:,}")
         m3.metric("% with Links", f"{pct}%")
 
-        # Exports
+        # Exports — paged off the SQLite cursor (no DataFrame→to_csv
+        # double copy) and memoized per filter combination, so reruns
+        # that don't change the filters reuse the built payload.
+        _filter_key = (
+            filter_channel if filter_channel != "All" else None,
+            search_msg or None,
+            has_link_val,
+        )
+
+        @st.cache_data(show_spinner=False, ttl=60)
+        def _msgs_csv(key) -> bytes:
+            return database.stream_messages_csv(
+                get_conn(), channel=key[0], keyword=key[1], has_link=key[2]
+            )
+
+        @st.cache_data(show_spinner=False, ttl=60)
+        def _msgs_json(key) -> bytes:
+            return database.stream_messages_json(
+                get_conn(), channel=key[0], keyword=key[1], has_link=key[2]
+            )
+
         exp1, exp2 = st.columns(2)
         with exp1:
-            csv_data = df_msgs.to_csv(index=False).encode("utf-8")
             ch_label = filter_channel if filter_channel != "All" else "all"
             st.download_button(
                 "⬇ Download CSV",
-                data=csv_data,
+                data=_msgs_csv(_filter_key),
                 file_name=f"telelink_messages_{ch_label}_{datetime.now().strftime('%Y-%m-%d')}.csv",
                 mime="text/csv",
                 key="msg_csv_dl",
             )
         with exp2:
-            json_data = df_msgs.to_json(orient="records", indent=2)
             st.download_button(
                 "⬇ Download JSON",
-                data=json_data,
+                data=_msgs_json(_filter_key),
                 file_name=f"telelink_messages_{ch_label}_{datetime.now().strftime('%Y-%m-%d')}.json",
                 mime="application/json",
                 key="msg_json_dl",
@@ -927,9 +1331,8 @@ with tab_messages:
 # ══════════════════════════════════════════════════════════════════════
 
 with tab_links:
-    conn = get_conn()
-    channel_list = database.get_channel_list(conn)
-    domain_list = database.get_domain_list(conn)
+    channel_list = _cached_channel_list()
+    domain_list = _cached_domain_list()
 
     f1, f2, f3, f4 = st.columns(4)
     with f1:
@@ -943,8 +1346,7 @@ with tab_links:
     with f4:
         unique_only = st.toggle("Unique URLs only", value=True, key="link_unique")
 
-    df_links = database.get_links(
-        conn,
+    df_links = _cached_links(
         channel=channel_filter if channel_filter != "All" else None,
         domain=domain_filter if domain_filter != "All" else None,
         unique_only=unique_only,
@@ -961,66 +1363,85 @@ with tab_links:
         m3.metric("Unique Domains", f"{df_links['domain'].nunique():,}")
         m4.metric("Channels Covered", f"{df_links['channel_name'].nunique():,}")
 
-        # Display table — make URLs clickable
-        display_links = df_links[["url", "domain", "anchor_text", "channel_name", "message_date", "source"]].copy()
-        display_links.columns = ["URL", "Domain", "Anchor Text", "Channel", "Date", "Source"]
-        display_links["Anchor Text"] = display_links["Anchor Text"].fillna("")
-        display_links["Source"] = display_links["Source"].fillna("")
-
-        # Render as clickable HTML
-        def _make_clickable(url):
-            short = (str(url)[:60] + "…") if len(str(url)) > 60 else str(url)
-            return f'<a href="{url}" target="_blank" style="color:#00d2ff;">{short}</a>'
-
-        html_df = display_links.copy()
-        html_df["URL"] = html_df["URL"].apply(_make_clickable)
-        st.markdown(
-            html_df.to_html(escape=False, index=False),
-            unsafe_allow_html=True,
+        # Display table — hand the memoized frame to the Arrow grid
+        # as-is (Streamlit converts it zero-copy); column_config handles
+        # labels and link cells, so no renamed/fillna copy of every
+        # column per rerun.
+        st.dataframe(
+            df_links,
+            column_order=["url", "domain", "anchor_text", "channel_name",
+                          "message_date", "source"],
+            column_config={
+                "url": st.column_config.LinkColumn(
+                    "URL", display_text=r"^(.{0,60}).*"
+                ),
+                "domain": "Domain",
+                "anchor_text": "Anchor Text",
+                "channel_name": "Channel",
+                "message_date": "Date",
+                "source": "Source",
+            },
+            use_container_width=True,
+            height=500,
         )
 
-        # Exports
-        exp1, exp2, exp3 = st.columns(3)
-        ch_label = channel_filter if channel_filter != "All" else "all"
-        
-        with exp1:
-            st.markdown("**(1) Grouped Links (URL, Domain, Anchor)**")
+        # Exports — both grouped CSV layouts come out of ONE groupby
+        # pass over the frame, and the serialized payloads are memoized
+        # per filter combination like the Messages-tab exports.
+        _links_key = (
+            channel_filter if channel_filter != "All" else None,
+            domain_filter if domain_filter != "All" else None,
+            unique_only,
+            search_url or None,
+        )
+
+        @st.cache_data(show_spinner=False, ttl=60)
+        def _grouped_csvs(key) -> tuple[bytes, bytes]:
             import io
             import csv
-            
+            df = _cached_links(*key)
             out1 = io.StringIO()
             w1 = csv.writer(out1)
-            
-            if not df_links.empty:
-                # Fetch message texts
-                msg_ids = tuple(df_links["message_id"].dropna().unique().astype(int).tolist())
-                msg_dict = {}
-                if msg_ids:
-                    placeholders = ",".join("?" * len(msg_ids))
-                    try:
-                        df_msgs = pd.read_sql_query(
-                            f"SELECT message_id, message_text FROM messages WHERE message_id IN ({placeholders})",
-                            conn, params=msg_ids,
-                        )
-                        msg_dict = dict(zip(df_msgs.message_id, df_msgs.message_text))
-                    except Exception:
-                        pass
-                
-                for msg_id, group in df_links.groupby("message_id"):
-                    text = msg_dict.get(msg_id, f"Message ID: {msg_id}")
-                    w1.writerow([f"Message: {text}"])
-                    w1.writerow(["URL", "Domain", "Anchor Text"])
-                    for _, row in group.iterrows():
-                        w1.writerow([
-                            row.get("url", ""), 
-                            row.get("domain", ""), 
-                            row.get("anchor_text", "")
-                        ])
-                    w1.writerow([]) # Blank row
-                    
+            out2 = io.StringIO()
+            w2 = csv.writer(out2)
+            # get_links already joined message_text in — no second
+            # IN(...) query (which also capped out at 999 params).
+            for msg_id, group in df.groupby("message_id"):
+                text = group["message_text"].iloc[0]
+                if pd.isna(text) or not text:
+                    text = f"Message ID: {msg_id}"
+                header = f"Message: {text}"
+                w1.writerow([header])
+                w1.writerow(["URL", "Domain", "Anchor Text"])
+                # itertuples skips iterrows' per-row Series boxing
+                w1.writerows(
+                    group[["url", "domain", "anchor_text"]]
+                    .fillna("")
+                    .itertuples(index=False, name=None)
+                )
+                w1.writerow([]) # Blank row
+                w2.writerow([header])
+                w2.writerows((url, "") for url in group["url"].fillna(""))
+                w2.writerow([])
+            return (
+                out1.getvalue().encode("utf-8"),
+                out2.getvalue().encode("utf-8"),
+            )
+
+        @st.cache_data(show_spinner=False, ttl=60)
+        def _links_json(key) -> str:
+            return _cached_links(*key).to_json(orient="records", indent=2)
+
+        detailed_csv, simple_csv = _grouped_csvs(_links_key)
+
+        exp1, exp2, exp3 = st.columns(3)
+        ch_label = channel_filter if channel_filter != "All" else "all"
+
+        with exp1:
+            st.markdown("**(1) Grouped Links (URL, Domain, Anchor)**")
             st.download_button(
                 "⬇ Export Detailed CSV",
-                data=out1.getvalue().encode("utf-8"),
+                data=detailed_csv,
                 file_name=f"telelink_detailed_{ch_label}_{datetime.now().strftime('%Y-%m-%d')}.csv",
                 mime="text/csv",
                 key="csv_dl_1",
@@ -1028,29 +1449,16 @@ with tab_links:
 
         with exp2:
             st.markdown("**(2) Simple Grouped (URL Only)**")
-            out2 = io.StringIO()
-            w2 = csv.writer(out2)
-            
-            if not df_links.empty:
-                for msg_id, group in df_links.groupby("message_id"):
-                    text = msg_dict.get(msg_id, f"Message ID: {msg_id}")
-                    w2.writerow([f"Message: {text}"])
-                    for _, row in group.iterrows():
-                        w2.writerow([row.get("url", ""), ""])
-                    w2.writerow([])
-                    
             st.download_button(
                 "⬇ Export Simple CSV",
-                data=out2.getvalue().encode("utf-8"),
+                data=simple_csv,
                 file_name=f"telelink_simple_{ch_label}_{datetime.now().strftime('%Y-%m-%d')}.csv",
                 mime="text/csv",
                 key="csv_dl_2",
             )
-        with exp2:
-            json_data = df_links.to_json(orient="records", indent=2)
             st.download_button(
                 "⬇ Export JSON",
-                data=json_data,
+                data=_links_json(_links_key),
                 file_name=f"telelink_links_{ch_label}_{datetime.now().strftime('%Y-%m-%d')}.json",
                 mime="application/json",
                 key="link_json_dl",
@@ -1066,11 +1474,10 @@ with tab_links:
 # ══════════════════════════════════════════════════════════════════════
 
 with tab_stats:
-    conn = get_conn()
 
     # Section 1 — Per-Channel Summary
     st.subheader("📊 Per-Channel Summary")
-    stats_df = database.get_channel_stats(conn)
+    stats_df = _cached_channel_stats()
     if stats_df.empty:
         st.info("No channel data yet. Scrape some channels first!")
     else:
@@ -1078,39 +1485,28 @@ with tab_stats:
 
     st.markdown("---")
 
-    # Need links data for charts
-    all_links = database.get_links(conn)
+    # Chart aggregations run inside SQLite (one index scan each) — the
+    # full links table never gets materialized as a DataFrame here.
+    top_domains = _cached_top_domains()
 
-    if not all_links.empty:
+    if not top_domains.empty:
         # Section 2 — Top 20 Domains
         st.subheader("🌐 Top 20 Domains")
-        domain_counts = (
-            all_links.groupby("domain")
-            .size()
-            .sort_values(ascending=False)
-            .head(20)
-        )
-        st.bar_chart(domain_counts)
+        st.bar_chart(top_domains.set_index("domain")["links"])
 
         st.markdown("---")
 
         # Section 3 — Links Over Time
         st.subheader("📈 Links Over Time")
-        if "message_date" in all_links.columns:
-            links_by_date = (
-                all_links["message_date"]
-                .str[:10]
-                .value_counts()
-                .sort_index()
-            )
-            st.line_chart(links_by_date)
+        links_by_date = _cached_links_per_day()
+        st.line_chart(links_by_date.set_index("day")["links"])
 
         st.markdown("---")
 
         # Section 4 — Link Source Breakdown
         st.subheader("🔍 Link Source Breakdown")
-        source_counts = all_links["source"].value_counts()
-        st.bar_chart(source_counts)
+        source_counts = _cached_source_counts()
+        st.bar_chart(source_counts.set_index("source")["links"])
     else:
         st.info("No link data available to chart. Scrape some channels first!")
 
@@ -1119,14 +1515,56 @@ with tab_stats:
 # TAB 6 — OPENER
 # ══════════════════════════════════════════════════════════════════════
 
+# One C-level pass over the raw upload bytes. Anchored to line starts
+# (modulo leading whitespace) like the old per-line parser — URLs
+# embedded mid-line in the Simple CSV's "Message: <text>" headers must
+# NOT be opened, only the one-URL-per-row lines; excluding commas and
+# quotes from the class reproduces the old strip(",") semantics.
+_OPENER_URL_RE = re.compile(rb"^[ \t]*(https?://[^\s,\"']+)", re.M)
+
 with tab_opener:
     st.subheader("🚀 Batch Link Opener")
     st.markdown("Upload a **Simple CSV** file to automatically open the links one-by-one in your default browser.")
     st.info("💡 **Note:** Python will strictly wait the number of seconds you configure below before opening the next tab. It does not literally 'detect' the web redirect finish, so assign enough time for your browser to load!")
     
-    if "opener_state" not in st.session_state:
-        st.session_state["opener_state"] = {"running": False, "stop": False, "index": 0, "total": 0}
-        
+    @st.cache_resource
+    def _opener_worker():
+        """One long-lived opener thread for the whole process.
+
+        Jobs arrive on a Queue and stop is a real threading.Event, so no
+        new 8 MB thread stack per Start click and the stop signal is seen
+        deterministically (the closure-over-session-state version raced
+        with Streamlit's per-rerun re-instantiation). Progress lives in a
+        plain dict — single-slot updates are GIL-atomic for the UI reader.
+        """
+        import webbrowser
+        jobs: queue.Queue = queue.Queue()
+        stop = threading.Event()
+        progress = {"running": False, "index": 0, "total": 0, "stopped": False}
+
+        def _run():
+            while True:
+                urls, wait = jobs.get()
+                stop.clear()
+                progress.update(running=True, index=0, total=len(urls), stopped=False)
+                for u in urls:
+                    if stop.is_set():
+                        progress["stopped"] = True
+                        break
+                    webbrowser.open_new_tab(u)
+                    progress["index"] += 1
+                    # Event.wait is an interruptible sleep — one kernel
+                    # call instead of the old wait*10 poll loop
+                    if stop.wait(wait):
+                        progress["stopped"] = True
+                        break
+                progress["running"] = False
+
+        threading.Thread(target=_run, daemon=True, name="link-opener").start()
+        return jobs, stop, progress
+
+    opener_jobs, opener_stop, state = _opener_worker()
+
     col_up, col_conf = st.columns([2, 1])
     
     with col_up:
@@ -1141,16 +1579,14 @@ with tab_opener:
             help="Seconds to wait between opening tabs."
         )
         
-    state = st.session_state["opener_state"]
-        
     if uploaded_file is not None:
         try:
-            content = uploaded_file.getvalue().decode("utf-8")
-            urls_to_open = []
-            for line in content.splitlines():
-                line = line.strip().strip(",")
-                if line.startswith("http://") or line.startswith("https://"):
-                    urls_to_open.append(line)
+            # Single regex scan over the raw bytes — no whole-file decode,
+            # no splitlines() intermediate list, no per-line Python loop.
+            urls_to_open = [
+                u.decode("utf-8", "ignore")
+                for u in _OPENER_URL_RE.findall(uploaded_file.getvalue())
+            ]
                     
             if not urls_to_open:
                 st.warning("No URLs found in the uploaded file.")
@@ -1162,31 +1598,17 @@ with tab_opener:
                 with c1:
                     start_disabled = state["running"]
                     if st.button("🚀 Start Opening", type="primary", disabled=start_disabled):
-                        state["running"] = True
-                        state["stop"] = False
-                        state["index"] = 0
-                        state["total"] = len(urls_to_open)
-                        
-                        def opener_worker(urls, wait, st_ref):
-                            import webbrowser
-                            for u in urls:
-                                if st_ref["stop"]:
-                                    break
-                                webbrowser.open_new_tab(u)
-                                st_ref["index"] += 1
-                                # Wait chunked to allow quick stoppage
-                                for _ in range(wait * 10):
-                                    if st_ref["stop"]: break
-                                    time.sleep(0.1)
-                            st_ref["running"] = False
-                            
-                        threading.Thread(target=opener_worker, args=(urls_to_open, wait_time, state), daemon=True).start()
+                        # Publish optimistically so the rerun that follows
+                        # sees "running" before the worker dequeues the job
+                        state.update(running=True, index=0,
+                                     total=len(urls_to_open), stopped=False)
+                        opener_jobs.put((urls_to_open, wait_time))
                         st.rerun()
-                        
+
                 with c2:
                     stop_disabled = not state["running"]
                     if st.button("🛑 Stop", disabled=stop_disabled):
-                        state["stop"] = True
+                        opener_stop.set()
                         st.rerun()
                 
                 # Status
@@ -1195,7 +1617,7 @@ with tab_opener:
                     st.progress(state["index"] / state["total"] if state["total"] > 0 else 0.0)
                 elif state["index"] > 0 and state["index"] == state["total"]:
                     st.success("✅ Finished opening all links!")
-                elif state["index"] > 0 and state["stop"]:
+                elif state["index"] > 0 and state["stopped"]:
                     st.error(f"🛑 Stopped at link {state['index']}.")
                     
         except Exception as e:
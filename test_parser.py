@@ -1,21 +1,29 @@
-import re
+import mmap
+
 html_file = r"C:\Users\Nikhil\Downloads\Telegram Desktop\ChatExport_2026-02-22\messages.html"
-with open(html_file, 'r', encoding='utf-8') as f:
-    html = f.read()
 
-print("Searching for 'Ep 1101-1200'...")
-idx = html.find('Ep 1101-1200')
-if idx != -1:
-    context = html[idx-300:idx+100]
-    print("HTML around the missing message:")
-    print("-" * 40)
-    print(context)
-    print("-" * 40)
-    
-    # Try the split manually on this chunk to see why it fails
-    msg_blocks = re.split(
-        r'(?=<div class="message (?:default|service) clearfix(?: joined)?")',
-        context,
-    )
-    print(f"Number of blocks found in context: {len(msg_blocks)}")
-    
+# Literal message-div prefix — same splitter parse_telegram_html uses.
+# str.split on a literal runs in CPython's byte scanner; the old
+# lookahead-regex split recompiled and backtracked per call.
+_MSG_DIV = b'<div class="message '
+
+# mmap instead of f.read(): the OS page cache backs the scan, so the
+# export is never copied into a Python str (halves peak RSS on big files)
+# and only the slice we actually print gets decoded.
+with open(html_file, 'rb') as f, \
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+    print("Searching for 'Ep 1101-1200'...")
+    idx = mm.find(b'Ep 1101-1200')
+    if idx != -1:
+        context = mm[max(idx - 300, 0):idx + 100]
+        print("HTML around the missing message:")
+        print("-" * 40)
+        print(context.decode('utf-8', 'replace'))
+        print("-" * 40)
+
+        # Try the split manually on this chunk to see why it fails
+        if _MSG_DIV in context:
+            msg_blocks = [_MSG_DIV + part for part in context.split(_MSG_DIV)[1:]]
+        else:
+            msg_blocks = []
+        print(f"Number of blocks found in context: {len(msg_blocks)}")